@@ -0,0 +1,61 @@
+import glob
+import os
+from collections.abc import Iterator
+from datetime import datetime
+
+from pipeline import Page
+from registry import CrawlerRegistry
+
+
+def get_html_files(raw_html_dir: str, source: str) -> list[tuple[str, datetime]]:
+    """Get all archived HTML files ({source}_YYYY_MM_DD.html) for a source with their dates.
+
+    Args:
+        raw_html_dir: Directory containing raw HTML files
+        source: Source name to match files for
+
+    Returns:
+        List of tuples containing (filename, date) for each matching file
+    """
+    pattern = os.path.join(raw_html_dir, f"{source}_*.html")
+    files = glob.glob(pattern)
+
+    if not files:
+        raise FileNotFoundError(f"No HTML files found for source: {source}")
+
+    html_files = []
+    for file_path in sorted(files):
+        file_name = os.path.basename(file_path)
+        date_parts = file_name.replace(".html", "").split("_")[1:]  # [YYYY, MM, DD]
+        html_date = datetime(
+            int(date_parts[0]),  # YYYY
+            int(date_parts[1]),  # MM
+            int(date_parts[2]),  # DD
+        )
+        html_files.append((file_name, html_date))
+
+    return html_files
+
+
+def replay_pages(raw_html_dir: str, sources: list[str] | None = None) -> Iterator[Page]:
+    """Read archived HTML files as pipeline pages, one file at a time.
+
+    Args:
+        raw_html_dir: Directory containing raw HTML files
+        sources: Sources to replay. If None, uses all registered crawlers.
+    """
+    if sources is None:
+        sources = list(CrawlerRegistry._crawlers.keys())
+
+    index = 0
+    for source in sources:
+        try:
+            html_files = get_html_files(raw_html_dir, source)
+        except FileNotFoundError as e:
+            print(f"Skipping {source}: {e!s}")
+            continue
+
+        for file_name, html_date in html_files:
+            with open(os.path.join(raw_html_dir, file_name), encoding="utf-8") as f:
+                yield Page(source=source, date=html_date, html_content=f.read(), index=index)
+            index += 1
@@ -1,24 +1,364 @@
+import hashlib
+import re
 from pathlib import Path
 from sys import stderr
+from typing import ClassVar
 
-import joblib
+import numpy as np
 
+from compiled_dict import CompiledDict
+from files import atomic_write
+from model_registry import ModelRegistry
 from models import Category
 
 
-class MenuCategorizer:
-    MODEL_DATE = "20250504"
+class TfidfLogisticModel:
+    """NumPy inference engine for char n-gram TfidfVectorizer + logistic classifier pipelines.
+
+    Prediction only needs the vocabulary, the IDF weights and the coefficients, so they are
+    exported from the trained pipeline and scored directly, without loading scikit-learn.
+    Scores match the pipeline's decision_function up to floating point rounding.
+
+    Both LogisticRegression (multinomial) and the incrementally trained
+    SGDClassifier(loss="log_loss") (one-vs-rest) are supported; they only differ in how
+    scores are turned into probabilities.
+    """
+
+    # TfidfVectorizer(analyzer="char")와 같게 연속된 공백을 하나로 줄인다
+    WHITE_SPACES = re.compile(r"\s\s+")
+    SUPPORTED_VECTORIZER: ClassVar[dict] = {
+        "analyzer": "char",
+        "preprocessor": None,
+        "strip_accents": None,
+        "lowercase": True,
+        "binary": False,
+        "use_idf": True,
+        "sublinear_tf": False,
+        "norm": "l2",
+    }
+    # 다항 로지스틱 회귀는 softmax로, 클래스별 로지스틱 회귀는 각 확률을 정규화해 확률을 낸다
+    MULTINOMIAL_CLASSIFIERS: ClassVar[dict[str, bool]] = {
+        "LogisticRegression": True,
+        "SGDClassifier": False,
+    }
+    multinomial = True
+
+    def __init__(
+        self,
+        vocabulary: list[str],
+        idf: np.ndarray,
+        coef: np.ndarray,
+        intercept: np.ndarray,
+        classes: list[str],
+    ):
+        """
+        Args:
+            vocabulary: N-grams, in the order of the feature columns
+            idf: IDF weight of each feature
+            coef: Coefficients of shape (classes, features)
+            intercept: Intercept of each class
+            classes: Class labels, in the order of the coefficient rows
+        """
+        self.vocabulary = dict(zip(vocabulary, range(len(vocabulary))))
+        self.ngram_range = (
+            min(map(len, vocabulary), default=1),
+            max(map(len, vocabulary), default=1),
+        )
+        self.idf = idf
+        # 특징별로 모든 클래스의 계수를 한 번에 더할 수 있도록 전치해 둔다
+        self.coef_t = np.ascontiguousarray(coef.T)
+        self.intercept = intercept
+        self.classes_ = np.array(classes, dtype=object)
+
+    @classmethod
+    def from_pipeline(cls, pipeline) -> "TfidfLogisticModel":
+        """Export a fitted make_pipeline(TfidfVectorizer, LogisticRegression or SGDClassifier)."""
+        vectorizer, classifier = pipeline[0], pipeline[-1]
+        classifier_name = type(classifier).__name__
+        # SGDClassifier는 loss="log_loss"일 때만 확률을 낸다
+        if classifier_name not in cls.MULTINOMIAL_CLASSIFIERS or not hasattr(
+            classifier, "predict_proba"
+        ):
+            raise ValueError(f"Unsupported classifier: {classifier!r}")
 
-    def __init__(self):
-        self.model = joblib.load(
-            Path(__file__).parent / "resources" / f"menu_classifier_{self.MODEL_DATE}.joblib"
+        params = vectorizer.get_params()
+        unsupported = {
+            name: params[name]
+            for name, value in cls.SUPPORTED_VECTORIZER.items()
+            if params[name] != value
+        }
+        if unsupported:
+            raise ValueError(f"Unsupported vectorizer parameters: {unsupported}")
+
+        vocabulary = sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get)
+        coef, intercept = classifier.coef_, classifier.intercept_
+        binary = len(coef) != len(classifier.classes_)
+        if binary:
+            # 이진 분류는 두 번째 클래스의 점수만 있으므로 첫 번째 클래스의 점수를 0으로 둔다
+            coef = np.vstack([np.zeros_like(coef), coef])
+            intercept = np.concatenate([[0.0], intercept])
+        model = cls(
+            vocabulary,
+            vectorizer.idf_.astype(np.float64),
+            coef.astype(np.float64),
+            intercept.astype(np.float64),
+            [str(label) for label in classifier.classes_],
+        )
+        # 이진 분류의 확률은 어느 쪽이든 두 점수의 softmax와 같다
+        model.multinomial = cls.MULTINOMIAL_CLASSIFIERS[classifier_name] or binary
+        return model
+
+    @classmethod
+    def from_compiled(cls, compiled: CompiledDict) -> "TfidfLogisticModel":
+        model = cls(
+            compiled.strings("vocabulary"),
+            compiled.array("idf"),
+            compiled.array("coef").reshape(len(compiled.strings("classes")), -1),
+            compiled.array("intercept"),
+            compiled.strings("classes"),
         )
+        model.multinomial = bool(compiled.array("multinomial")[0])
+        return model
+
+    def dumps(self, source_hash: str) -> bytes:
+        """Serialize the model into the compiled artifact format."""
+        return CompiledDict.dumps(
+            source_hash,
+            {"vocabulary": list(self.vocabulary), "classes": list(self.classes_)},
+            {
+                "idf": self.idf,
+                "coef": self.coef_t.T,
+                "intercept": self.intercept,
+                "multinomial": np.array([self.multinomial], dtype=np.int8),
+            },
+        )
+
+    def _ngrams(self, text: str) -> list[str]:
+        text = self.WHITE_SPACES.sub(" ", text.lower())
+        min_n, max_n = self.ngram_range
+        return [
+            text[i : i + n]
+            for n in range(min_n, min(max_n, len(text)) + 1)
+            for i in range(len(text) - n + 1)
+        ]
+
+    def decision_function(self, texts: list[str]) -> np.ndarray:
+        """Score every class for each text.
+
+        Returns:
+            Scores of shape (len(texts), classes)
+        """
+        rows, columns = [], []
+        for row, text in enumerate(texts):
+            for gram in self._ngrams(text):
+                column = self.vocabulary.get(gram)
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+
+        rows = np.array(rows, dtype=np.int64)
+        columns = np.array(columns, dtype=np.int64)
+        # 같은 (문서, n-gram) 쌍의 등장 횟수가 tf가 된다
+        pairs, tf = np.unique(rows * len(self.idf) + columns, return_counts=True)
+        rows, columns = np.divmod(pairs, len(self.idf))
+        weights = tf * self.idf[columns]
+        norms = np.sqrt(np.bincount(rows, weights=weights**2, minlength=len(texts)))
+        weights /= norms[rows]
+
+        scores = np.tile(self.intercept, (len(texts), 1))
+        np.add.at(scores, rows, weights[:, None] * self.coef_t[columns])
+        return scores
+
+    def predict_proba(self, texts: list[str]) -> np.ndarray:
+        """Probability of every class for each text."""
+        scores = self.decision_function(texts)
+        if self.multinomial:
+            scores -= scores.max(axis=1, keepdims=True)
+            probabilities = np.exp(scores)
+        else:
+            probabilities = 1 / (1 + np.exp(-scores))
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        return probabilities
+
+    def predict(self, texts: list[str]) -> np.ndarray:
+        return self.classes_[self.decision_function(texts).argmax(axis=1)]
+
+
+class MenuCategorizer:
+    # 승격된 모델을 고르는 모델 레지스트리 (update-dict --promote로 변경)
+    REGISTRY_PATH = ModelRegistry.DEFAULT_PATH
+    ENGINE_VERSION = 2
+    DEFAULT_TOP_K = 3
+
+    def __init__(self, confidence_floor: float = 0.0, model_path: str | Path | None = None):
+        """
+        Args:
+            confidence_floor: Probability below which a prediction is reported as
+                Category.ETC_UNKNOWN instead of its most likely category (0 keeps every guess)
+            model_path: joblib file of the model to use instead of the promoted one
+        """
+        self.confidence_floor = confidence_floor
+        self.model_path = Path(model_path) if model_path else self.promoted_model()[1]
+        # 학습된 모델에서 추출한 NumPy 추론용 배열 (update-dict --export-model로 생성)
+        engine_path = self.model_path.with_suffix(".bin")
+        self.model = self._load_engine(self.model_path, engine_path)
+        if self.model is None:
+            stderr.write(
+                f"Exported model not found or stale: {engine_path}, falling back to scikit-learn\n"
+            )
+            self.model = self._load_pipeline(self.model_path)
+
+    @classmethod
+    def promoted_model(cls) -> tuple[str, Path]:
+        """Get the version and file of the model promoted in the model registry.
+
+        Raises:
+            OSError, ValueError: If the registry cannot be read
+            ValueError: If the registry promotes no registered model
+        """
+        promoted = ModelRegistry(cls.REGISTRY_PATH).promoted_model()
+        if promoted is None:
+            raise ValueError(f"No promoted model in {cls.REGISTRY_PATH}")
+        return promoted
+
+    @classmethod
+    def _source_hash(cls, model_path: Path) -> str:
+        digest = hashlib.sha256(model_path.read_bytes())
+        digest.update(f"{cls.ENGINE_VERSION}".encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def _load_engine(cls, model_path: Path, engine_path: Path) -> TfidfLogisticModel | None:
+        compiled = CompiledDict.load(engine_path, cls._source_hash(model_path))
+        return TfidfLogisticModel.from_compiled(compiled) if compiled else None
+
+    @staticmethod
+    def _load_pipeline(model_path: Path):
+        # scikit-learn은 불러오는 데만 1초 가까이 걸리므로 필요할 때만 불러온다
+        import joblib  # noqa: PLC0415
+
+        return joblib.load(model_path)
+
+    @classmethod
+    def export(cls, model_path: Path | None = None) -> Path:
+        """Export a trained pipeline into the arrays loaded by the NumPy inference engine.
+
+        Args:
+            model_path: joblib file of the trained pipeline (default: the promoted model)
+
+        Returns:
+            Path of the exported model, next to model_path
+        """
+        model_path = model_path or cls.promoted_model()[1]
+        engine_path = model_path.with_suffix(".bin")
+        model = TfidfLogisticModel.from_pipeline(cls._load_pipeline(model_path))
+        atomic_write(engine_path, model.dumps(cls._source_hash(model_path)))
+        return engine_path
 
     def categorize(self, menu_name: str) -> Category | None:
         """Category the menu name using pre-trained logistic regression model(tf-idf vectorizer)."""
+        return self.categorize_many([menu_name])[0]
+
+    def categorize_many(self, menu_names: list[str | None]) -> list[Category | None]:
+        """Categorize many menu names with a single predict_proba call.
+
+        Args:
+            menu_names: Canonical menu names (None for menus that could not be normalized)
+
+        Returns:
+            Categories in the same order as menu_names (None if not categorized). Guesses less
+            likely than the confidence floor are Category.ETC_UNKNOWN.
+        """
+        return [self.select(scores) for scores in self.categorize_top_k(menu_names, k=1)]
+
+    def categorize_top_k(
+        self,
+        menu_names: list[str | None],
+        k: int = DEFAULT_TOP_K,
+        include: dict[str, Category] | None = None,
+    ) -> list[list[tuple[Category, float]]]:
+        """Get the k most likely categories of many menu names with their probabilities.
+
+        Duplicate names are predicted once, in a single predict_proba call. If the batch fails,
+        names are predicted one by one so that a single bad name only loses its own categories.
+
+        Args:
+            menu_names: Canonical menu names (None for menus that could not be normalized)
+            k: Number of categories to return per name
+            include: Category to score for each name even when it is not among the k most
+                likely. It is added last, with probability 0 if the model has no such class.
+
+        Returns:
+            (category, probability) pairs from the most likely, in the same order as
+            menu_names (empty if not categorized)
+        """
+        unique_names = [name for name in dict.fromkeys(menu_names) if name]
+        if not unique_names:
+            return [[] for _ in menu_names]
+
         try:
-            category_name = self.model.predict([menu_name])[0]
-            return Category(category_name)
+            probabilities = np.asarray(self.model.predict_proba(unique_names), dtype=np.float64)
         except Exception as e:
-            stderr.write(f"Error categorizing menu name: {e!s}\n")
+            stderr.write(f"Error categorizing menu names, retrying one by one: {e!s}\n")
+            probabilities = np.array([self._predict_proba(name) for name in unique_names])
+
+        # 확률이 같으면 predict와 같게 앞선 클래스를 고른다
+        ranks = np.argsort(-probabilities, axis=1, kind="stable")
+        scores = {
+            name: self._top_k(name, row, order, k)
+            for name, row, order in zip(unique_names, probabilities, ranks)
+        }
+        if include:
+            class_index = {name: index for index, name in enumerate(self.model.classes_)}
+            for name, row in zip(unique_names, probabilities):
+                category = include.get(name)
+                if category is None or not scores[name] or category in dict(scores[name]):
+                    continue
+                index = class_index.get(category.value)
+                scores[name].append((category, 0.0 if index is None else float(row[index])))
+        return [scores.get(name, []) for name in menu_names]
+
+    def select(self, scores: list[tuple[Category, float]]) -> Category | None:
+        """Pick the category of a menu from its top-k scores, applying the confidence floor."""
+        if not scores:
+            return None
+        category, probability = scores[0]
+        return category if probability >= self.confidence_floor else Category.ETC_UNKNOWN
+
+    def _predict_proba(self, menu_name: str) -> np.ndarray:
+        try:
+            return np.asarray(self.model.predict_proba([menu_name])[0], dtype=np.float64)
+        except Exception as e:
+            stderr.write(f"Error categorizing menu name {menu_name!r}: {e!s}\n")
+            return np.full(len(self.model.classes_), np.nan)
+
+    def _top_k(
+        self, menu_name: str, probabilities: np.ndarray, order: np.ndarray, k: int
+    ) -> list[tuple[Category, float]]:
+        scores = []
+        for index in order:
+            if len(scores) == k or np.isnan(probabilities[index]):
+                break
+            category = self.to_category(menu_name, self.model.classes_[index])
+            if category is not None:
+                scores.append((category, float(probabilities[index])))
+        return scores
+
+    @staticmethod
+    def to_category(menu_name: str, category_name: str | None) -> Category | None:
+        """Convert a category name from the model or the dictionary to a Category.
+
+        Args:
+            menu_name: Menu name the category belongs to, used in the warning for unknown names
+            category_name: Category name (None if not categorized)
+
+        Returns:
+            The matching Category (None if category_name is None or unknown)
+        """
+        if category_name is None:
+            return None
+        try:
+            return Category(category_name)
+        except ValueError:
+            stderr.write(f"Unknown category {category_name!r} for menu name {menu_name!r}\n")
             return None
@@ -0,0 +1,94 @@
+import json
+import mmap
+import struct
+from pathlib import Path
+
+import numpy as np
+
+
+class CompiledDict:
+    """Read-only, memory-mapped binary artifact of named string lists and numpy arrays.
+
+    Layout: MAGIC, the length of a JSON header (little-endian uint32), the header, then every
+    section aligned to 8 bytes. The header records the hash of the source the artifact was
+    compiled from, so a stale artifact is detected without reading its sections.
+    """
+
+    MAGIC = b"SIKSHADICT\x00\x01"
+    ALIGNMENT = 8
+
+    def __init__(self, buffer: bytes | mmap.mmap):
+        if buffer[: len(self.MAGIC)] != self.MAGIC:
+            raise ValueError("Not a compiled dictionary")
+        header_start = len(self.MAGIC) + 4
+        (header_length,) = struct.unpack("<I", buffer[len(self.MAGIC) : header_start])
+        header = json.loads(buffer[header_start : header_start + header_length])
+
+        self.buffer = buffer
+        self.source_hash: str = header["source_hash"]
+        self.sections: dict[str, dict] = header["sections"]
+        self._data_start = header_start + header_length
+
+    @classmethod
+    def load(cls, path: str | Path, source_hash: str) -> "CompiledDict | None":
+        """Memory-map the artifact at path, or return None if it is missing or stale."""
+        try:
+            with open(path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            compiled = cls(buffer)
+        except (ValueError, KeyError, struct.error):
+            compiled = None
+        if compiled is None or compiled.source_hash != source_hash:
+            buffer.close()
+            return None
+        return compiled
+
+    @classmethod
+    def dumps(
+        cls, source_hash: str, strings: dict[str, list[str]], arrays: dict[str, np.ndarray]
+    ) -> bytes:
+        """Serialize string lists and arrays into the artifact format."""
+        blobs = {name: "\0".join(values).encode("utf-8") for name, values in strings.items()}
+        blobs.update(
+            {name: np.ascontiguousarray(array).tobytes() for name, array in arrays.items()}
+        )
+
+        sections, offset = {}, 0
+        for name, blob in blobs.items():
+            sections[name] = {"offset": offset, "length": len(blob)}
+            if name in arrays:
+                sections[name]["dtype"] = arrays[name].dtype.str
+            else:
+                sections[name]["count"] = len(strings[name])
+            offset += -(-len(blob) // cls.ALIGNMENT) * cls.ALIGNMENT
+
+        header = json.dumps({"source_hash": source_hash, "sections": sections}).encode()
+        # 섹션이 정렬되도록 헤더 뒤를 채운다
+        header += b" " * (-(len(cls.MAGIC) + 4 + len(header)) % cls.ALIGNMENT)
+        data = bytearray(cls.MAGIC + struct.pack("<I", len(header)) + header)
+        for blob in blobs.values():
+            data += blob + b"\0" * (-len(blob) % cls.ALIGNMENT)
+        return bytes(data)
+
+    def _section(self, name: str) -> tuple[int, int]:
+        section = self.sections[name]
+        start = self._data_start + section["offset"]
+        return start, start + section["length"]
+
+    def strings(self, name: str) -> list[str]:
+        if not self.sections[name]["count"]:
+            return []
+        start, end = self._section(name)
+        return self.buffer[start:end].decode("utf-8").split("\0")
+
+    def array(self, name: str) -> np.ndarray:
+        """Get an array section without copying it out of the artifact."""
+        start, end = self._section(name)
+        dtype = np.dtype(self.sections[name]["dtype"])
+        return np.frombuffer(
+            self.buffer, dtype=dtype, count=(end - start) // dtype.itemsize, offset=start
+        )
@@ -1,12 +1,57 @@
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import ClassVar
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
 
 from models import BreakfastSchedule, DinnerSchedule, LunchSchedule
 
+from .session import HttpSession
+
+# lxml(C 구현)이 설치되어 있으면 사용하고, 없으면 내장 html.parser를 사용한다
+DEFAULT_PARSER = "lxml" if builder_registry.lookup("lxml") else "html.parser"
+
 
 class BaseCrawler(ABC):
     """Base class for all crawlers that defines the common interface."""
 
+    PARSE_ONLY: ClassVar[SoupStrainer | None] = None
+    """Part of the document the crawler reads. Other elements are skipped while parsing."""
+
+    _default_session: ClassVar[HttpSession | None] = None
+    _default_session_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, session: HttpSession | None = None, parser: str = DEFAULT_PARSER):
+        self._session = session
+        self.parser = parser
+
+    @property
+    def session(self) -> HttpSession:
+        """Session used to fetch pages. Falls back to the shared session on first use."""
+        if self._session is None:
+            self._session = BaseCrawler.get_default_session()
+        return self._session
+
+    @classmethod
+    def get_default_session(cls) -> HttpSession:
+        """Get the session shared by every crawler, so requests to a host reuse connections."""
+        with BaseCrawler._default_session_lock:
+            if BaseCrawler._default_session is None:
+                BaseCrawler._default_session = HttpSession()
+            return BaseCrawler._default_session
+
+    @classmethod
+    def set_default_session(cls, session: HttpSession):
+        """Replace the shared session, e.g. to change timeouts or the transport."""
+        with BaseCrawler._default_session_lock:
+            BaseCrawler._default_session = session
+
+    def make_soup(self, html_content: str) -> BeautifulSoup:
+        """Build a soup of the PARSE_ONLY subtree with the configured parser backend."""
+        return BeautifulSoup(html_content, self.parser, parse_only=self.PARSE_ONLY)
+
     @property
     @abstractmethod
     def base_url(self) -> str:
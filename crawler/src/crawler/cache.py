@@ -0,0 +1,151 @@
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from files import atomic_write
+
+
+class CachedResponse(NamedTuple):
+    url: str
+    body: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that let the server answer 304 Not Modified for this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """On-disk cache of fetched pages keyed by full URL (including the ?date= query).
+
+    Entries are revalidated with conditional GET, so only responses carrying an ETag or
+    Last-Modified header are stored. Entries older than max_age are dropped, and the least
+    recently stored entries are evicted once the cache grows past max_bytes, which is checked
+    against a running total on every write. A write that crosses max_bytes evicts down to
+    LOW_WATERMARK of it, so eviction does not run again on every following write.
+    """
+
+    DEFAULT_DIR = Path(__file__).parent.parent.parent / ".cache" / "http"
+    MAX_AGE = 14 * 24 * 60 * 60  # seconds
+    MAX_BYTES = 64 * 1024 * 1024
+    LOW_WATERMARK = 0.9
+    # 이보다 오래된 임시 파일은 쓰다가 중단된 것으로 보고 지운다
+    STALE_TMP_AGE = 60 * 60  # seconds
+
+    def __init__(
+        self,
+        cache_dir: str | Path = DEFAULT_DIR,
+        max_age: float = MAX_AGE,
+        max_bytes: int = MAX_BYTES,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = 0
+        self.evict()
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Get the cached response for url, or None if missing or expired."""
+        path = self._path(url)
+        try:
+            with path.open(encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry["stored_at"] > self.max_age:
+            path.unlink(missing_ok=True)
+            return None
+
+        return CachedResponse(
+            url=entry["url"],
+            body=entry["body"],
+            etag=entry.get("etag"),
+            last_modified=entry.get("last_modified"),
+        )
+
+    def put(self, url: str, body: str, etag: str | None, last_modified: str | None):
+        """Store a response. Responses without validators cannot be revalidated and are skipped."""
+        if not etag and not last_modified:
+            return
+
+        entry = {
+            "url": url,
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+        }
+        data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        path = self._path(url)
+        try:
+            replaced_size = path.stat().st_size
+        except OSError:
+            replaced_size = 0
+
+        # 여러 스레드가 같은 URL을 동시에 쓸 수 있으므로 임시 파일에 쓴 뒤 교체한다
+        atomic_write(path, data)
+
+        with self._lock:
+            self._size += len(data) - replaced_size
+            over_budget = self._size > self.max_bytes
+        if over_budget:
+            self.evict(int(self.max_bytes * self.LOW_WATERMARK))
+
+    def touch(self, url: str):
+        """Mark an entry as fresh again after the server answered 304 Not Modified."""
+        cached = self.get(url)
+        if cached:
+            self.put(url, cached.body, cached.etag, cached.last_modified)
+
+    def evict(self, target_bytes: int | None = None):
+        """Drop expired entries, then the least recently stored ones until under target_bytes.
+
+        Temporary files left behind by interrupted writes are dropped as well.
+
+        Args:
+            target_bytes: Size to evict down to (max_bytes if None)
+        """
+        if target_bytes is None:
+            target_bytes = self.max_bytes
+        with self._lock:
+            now = time.time()
+            for path in self.cache_dir.glob("*.tmp"):
+                try:
+                    if now - path.stat().st_mtime > self.STALE_TMP_AGE:
+                        path.unlink(missing_ok=True)
+                except OSError:
+                    continue
+
+            entries = []
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                if now - stat.st_mtime > self.max_age:
+                    path.unlink(missing_ok=True)
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= target_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+            self._size = total
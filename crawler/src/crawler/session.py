@@ -0,0 +1,72 @@
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+from .cache import ResponseCache
+
+
+class HttpSession:
+    """Pooled keep-alive HTTP session shared by crawlers.
+
+    `ACCEPT_ENCODING` advertises brotli (and zstd) only when urllib3 can decode it,
+    so installing `brotli` is enough to negotiate it.
+    """
+
+    DEFAULT_TIMEOUT = (5.0, 30.0)  # (connect, read) seconds
+    POOL_SIZE = 8
+
+    def __init__(
+        self,
+        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+        pool_size: int = POOL_SIZE,
+        transport: BaseAdapter | None = None,
+        cache: ResponseCache | None = None,
+    ):
+        """
+        Args:
+            timeout: Timeout passed to every request, either a single value or (connect, read)
+            pool_size: Number of keep-alive connections kept per host
+            transport: Adapter to send requests with. Tests can pass a local stand-in here.
+            cache: Optional on-disk cache used to revalidate pages with conditional GET
+        """
+        self.timeout = timeout
+        self.cache = cache
+        self.session = requests.Session()
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+        adapter = transport or HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request and raise on HTTP errors."""
+        kwargs.setdefault("timeout", self.timeout)
+        response = self.session.get(url, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def get_text(self, url: str) -> str:
+        """Fetch a page and return its decoded body.
+
+        With a cache, the request carries If-None-Match / If-Modified-Since and a
+        304 Not Modified answer is served from disk.
+        """
+        if self.cache is None:
+            return self.get(url).text
+
+        cached = self.cache.get(url)
+        response = self.get(url, headers=cached.conditional_headers() if cached else None)
+        if cached and response.status_code == requests.codes.not_modified:
+            self.cache.touch(url)
+            return cached.body
+
+        self.cache.put(
+            url,
+            response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return response.text
+
+    def close(self):
+        self.session.close()
@@ -1,8 +1,7 @@
 import re
 from datetime import datetime
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
 from models import BreakfastSchedule, CafeteriaCorner, DinnerSchedule, LunchSchedule, MealType, Menu
 
@@ -14,6 +13,7 @@ class SnucoCrawler(BaseCrawler):
 
     base_url = "https://snuco.snu.ac.kr/foodmenu/"
     supports_date = True
+    PARSE_ONLY = SoupStrainer("table", class_="menu-table")
 
     CAFETERIA_REGEX = r"^(.*?)\s*(?:\((.*?)\))?$"
     """CAFETERIA_REGEX 정규표현식 예시
@@ -72,9 +72,7 @@ class SnucoCrawler(BaseCrawler):
             url += f"?date={date.strftime('%Y-%m-%d')}"
 
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.text
+            return self.session.get_text(url)
         except Exception as e:
             raise Exception(f"Error fetching {url}: {e}") from e
 
@@ -193,7 +191,7 @@ class SnucoCrawler(BaseCrawler):
         target_date = date.date()
         schedules = []
 
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = self.make_soup(html_content)
 
         menu_table_body = soup.find("table", class_="menu-table").find("tbody")
 
@@ -1,8 +1,7 @@
 import re
 from datetime import datetime
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
 from models import BreakfastSchedule, CafeteriaCorner, DinnerSchedule, LunchSchedule, MealType, Menu
 
@@ -14,6 +13,7 @@ class SnudormCrawler(BaseCrawler):
 
     base_url = "https://snudorm.snu.ac.kr/foodmenu/"
     supports_date = True
+    PARSE_ONLY = SoupStrainer("table", class_="menu-table")
 
     MENU_REGEX = r"^(?:(?:(?![\d,]+원)([^:]+?))\s*(?::\s*)?)?([\d,]+원)?\s*$"
     """MENU_REGEX 정규표현식 예시
@@ -31,9 +31,7 @@ class SnudormCrawler(BaseCrawler):
             url += f"?date={date.strftime('%Y-%m-%d')}"
 
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.text
+            return self.session.get_text(url)
         except Exception as e:
             raise Exception(f"Error fetching {url}: {e}") from e
 
@@ -107,7 +105,7 @@ class SnudormCrawler(BaseCrawler):
         target_date = date.date()
         schedules = []
 
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = self.make_soup(html_content)
 
         menu_table_body = soup.find("table", class_="menu-table").find("tbody")
 
@@ -1,7 +1,6 @@
 from datetime import datetime
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
 from models import BreakfastSchedule, CafeteriaCorner, DinnerSchedule, LunchSchedule, MealType, Menu
 
@@ -13,13 +12,13 @@ class SnuvetCrawler(BaseCrawler):
 
     base_url = "https://vet.snu.ac.kr/금주의-식단/"
     supports_date = False
+    # "금주의 식단" 제목과 그 뒤의 점심 표, 저녁 안내 목록만 읽는다
+    PARSE_ONLY = SoupStrainer(["h2", "table", "ul"])
 
     def fetch_html(self, date: datetime | None = None) -> str:
         """Fetch HTML content from SNU veterinary cafeteria website."""
         try:
-            response = requests.get(self.base_url)
-            response.raise_for_status()
-            return response.text
+            return self.session.get_text(self.base_url)
         except Exception as e:
             raise Exception(f"Error fetching {self.base_url}: {e}") from e
 
@@ -35,7 +34,7 @@ class SnuvetCrawler(BaseCrawler):
         target_date = date.date()
         schedules = []
 
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = self.make_soup(html_content)
 
         # 수의대 식당은 property="og:description"인 meta tag에 식단 정보가 있음
         # 하지만 언제까지 유지될 지 모르니 활용하지 않는다
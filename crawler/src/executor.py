@@ -0,0 +1,118 @@
+import itertools
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import NamedTuple, TypeVar
+from urllib.parse import urlparse
+
+from crawler.base import BaseCrawler
+from models import BreakfastSchedule, DinnerSchedule, LunchSchedule
+from registry import CrawlerRegistry
+
+T = TypeVar("T")
+
+DEFAULT_PROCESSES = os.cpu_count() or 1
+
+
+class CrawlUnit(NamedTuple):
+    """A single (crawler, date) pair of work."""
+
+    crawler_class: type[BaseCrawler]
+    date: datetime | None = None
+
+
+class CrawlExecutor:
+    """Run crawl units on a bounded thread pool with a concurrency limit per host."""
+
+    DEFAULT_WORKERS = 8
+    MAX_REQUESTS_PER_HOST = 4
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, per_host: int = MAX_REQUESTS_PER_HOST):
+        self.workers = max(1, workers)
+        self.per_host = max(1, per_host)
+        self._host_limits: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _host_limit(self, crawler_class: type[BaseCrawler]) -> threading.BoundedSemaphore:
+        host = urlparse(crawler_class.base_url).netloc
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_limits[host]
+
+    def as_completed(
+        self, func: Callable[[CrawlUnit], T], units: Iterable[CrawlUnit]
+    ) -> Iterator[tuple[int, T]]:
+        """Apply func to every unit concurrently, yielding (index, result) as each one finishes.
+
+        At most twice as many units as workers are in flight, so a slow consumer holds back
+        new work instead of letting finished results pile up.
+
+        Args:
+            func: Function to run for each unit. It is called while holding the
+                  concurrency slot of the unit's host.
+            units: Work units to process
+
+        Returns:
+            (index of the unit in units, result of func) in completion order
+
+        """
+        indexed_units = enumerate(units)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {
+                pool.submit(self._run, func, unit): index
+                for index, unit in itertools.islice(indexed_units, self.workers * 2)
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    for next_index, unit in itertools.islice(indexed_units, 1):
+                        pending[pool.submit(self._run, func, unit)] = next_index
+                    yield index, future.result()
+
+    def _run(self, func: Callable[[CrawlUnit], T], unit: CrawlUnit) -> T:
+        with self._host_limit(unit.crawler_class):
+            return func(unit)
+
+
+class ParseJob(NamedTuple):
+    """A page to parse, identified by the source name so it can be sent to another process."""
+
+    source: str
+    html_content: str
+    date: datetime
+
+
+def parse_job(job: ParseJob) -> list[BreakfastSchedule | LunchSchedule | DinnerSchedule] | None:
+    """Parse a single page, returning None if the crawler fails to parse it."""
+    crawler_class = CrawlerRegistry.get_crawler(job.source)
+    try:
+        return crawler_class().parse(job.html_content, job.date)
+    except Exception as e:
+        print(f"Error parsing {crawler_class.__name__} for {job.date.date()}: {e!s}")
+        return None
+
+
+def parse_pages(
+    jobs: Iterable[ParseJob], processes: int = DEFAULT_PROCESSES
+) -> list[list[BreakfastSchedule | LunchSchedule | DinnerSchedule] | None]:
+    """Parse pages on a process pool, since parsing is CPU-bound.
+
+    Args:
+        jobs: Pages to parse
+        processes: Number of worker processes. With 1, pages are parsed in this process.
+
+    Returns:
+        Parsed schedules (or None for pages that failed to parse) in the same order as jobs
+
+    """
+    jobs = list(jobs)
+    if processes <= 1 or len(jobs) <= 1:
+        return [parse_job(job) for job in jobs]
+
+    processes = min(processes, len(jobs))
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(parse_job, jobs, chunksize=max(1, len(jobs) // (processes * 4))))
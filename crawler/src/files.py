@@ -0,0 +1,27 @@
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write(path: str | Path, data: bytes | str):
+    """Replace the file at path with data, so readers never see a partially written file.
+
+    The data is written to a temporary file in the same directory, which is then renamed
+    over path. The temporary file is removed if anything fails.
+
+    Args:
+        path: File to write. Missing parent directories are created.
+        data: Content to write (str is encoded as UTF-8)
+    """
+    path = Path(path)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        Path(tmp_path).unlink(missing_ok=True)
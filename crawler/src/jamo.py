@@ -0,0 +1,25 @@
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+# 초성, 중성, 종성 (한글 호환 자모)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"]
+
+
+def decompose(text: str) -> str:
+    """Decompose Hangul syllables into jamo, e.g. "찌개" -> "ㅉㅣㄱㅐ".
+
+    Characters other than Hangul syllables are kept as they are.
+    """
+    jamo = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            jamo.append(CHOSEONG[offset // 588])
+            jamo.append(JUNGSEONG[offset // 28 % 21])
+            jamo.append(JONGSEONG[offset % 28])
+        else:
+            jamo.append(char)
+    return "".join(jamo)
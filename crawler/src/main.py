@@ -1,11 +1,28 @@
 import argparse
+import hashlib
+import time
 from datetime import datetime, timedelta
+from pathlib import Path
 
+import archive
 from categorizer import MenuCategorizer
 from crawler.base import BaseCrawler
+from crawler.cache import ResponseCache
+from crawler.session import HttpSession
+from executor import DEFAULT_PROCESSES, CrawlExecutor, CrawlUnit
+from manifest import BackfillManifest
 from models import BreakfastSchedule, DinnerSchedule, LunchSchedule
+from normalize_cache import NormalizeCache
 from normalizer import MenuNormalizer
+from page_store import PageStore
+from pipeline import Pipeline
 from registry import CrawlerRegistry
+from shared import SharedResources
+
+# 같은 사전과 모델로도 정규화/분류 결과가 바뀌는 변경을 할 때마다 올린다 (저장된 페이지를 다시 처리)
+PIPELINE_VERSION = 4
+
+DEFAULT_METRICS_PATH = Path(__file__).parent.parent / ".cache" / "metrics.json"
 
 
 def parse_args():
@@ -13,55 +30,212 @@ def parse_args():
     parser.add_argument(
         "--days", type=int, default=7, help="Number of days to crawl in future (default: 7)"
     )
+    parser.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="Run the pipeline on archived {source}_YYYY_MM_DD.html files instead of the network",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=CrawlExecutor.DEFAULT_WORKERS,
+        help=f"Number of concurrent crawl workers (default: {CrawlExecutor.DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=DEFAULT_PROCESSES,
+        help=f"Number of processes used to parse pages (default: {DEFAULT_PROCESSES})",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=HttpSession.DEFAULT_TIMEOUT[1],
+        help=f"HTTP read timeout in seconds (default: {HttpSession.DEFAULT_TIMEOUT[1]:g})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(ResponseCache.DEFAULT_DIR),
+        help="Directory of the HTTP response cache used for conditional requests",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch full pages without the HTTP response cache",
+    )
+    parser.add_argument(
+        "--store-dir",
+        default=str(PageStore.DEFAULT_DIR),
+        help="Directory of processed pages reused when a page has not changed",
+    )
+    parser.add_argument(
+        "--normalize-cache",
+        default=str(NormalizeCache.DEFAULT_PATH),
+        help="File of normalization results reused across runs",
+    )
+    parser.add_argument(
+        "--no-normalize-cache",
+        action="store_true",
+        help="Keep normalization results in memory only, without reading or writing the file",
+    )
+    parser.add_argument(
+        "--confidence-floor",
+        type=float,
+        default=0.0,
+        help=(
+            "Categorize menus without a reviewed category that are predicted with a lower "
+            "probability as 기타 (default: 0)"
+        ),
+    )
+    parser.add_argument(
+        "--metrics-json",
+        default=str(DEFAULT_METRICS_PATH),
+        help="Where to write per-stage timings and counters of the run",
+    )
+    parser.add_argument(
+        "--metrics-prom",
+        metavar="PATH",
+        help="Also write the metrics as a Prometheus textfile to this path",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Reprocess every page even if it has not changed since the last run",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+    backfill_parser = subparsers.add_parser(
+        "backfill", help="Crawl a past date range, resuming from the last checkpoint"
+    )
+    backfill_parser.add_argument(
+        "--start", type=parse_date, required=True, help="First date to crawl (YYYY-MM-DD)"
+    )
+    backfill_parser.add_argument(
+        "--end", type=parse_date, default=None, help="Last date to crawl (default: today)"
+    )
+    backfill_parser.add_argument(
+        "--manifest",
+        default=str(BackfillManifest.DEFAULT_PATH),
+        help="Checkpoint file of completed (source, date) units",
+    )
     return parser.parse_args()
 
 
-def run_crawlers(days: int) -> list[BreakfastSchedule | LunchSchedule | DinnerSchedule]:
-    crawlers: list[type[BaseCrawler]] = CrawlerRegistry.get_all_crawlers()
-    start_date = datetime.today()
+def parse_date(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%d")
+
 
-    schedules = []
+def run_crawlers(
+    days: int, pipeline: Pipeline | None = None
+) -> list[BreakfastSchedule | LunchSchedule | DinnerSchedule]:
+    """Crawl every (crawler, date) unit through the streaming pipeline, in registry order."""
+    start_date = datetime.today()
 
-    for crawler_class in crawlers:
+    units = []
+    for crawler_class in CrawlerRegistry.get_all_crawlers():
         if crawler_class.supports_date:
             for i in range(days):
-                target_date = start_date + timedelta(days=i)
-                print(f"Running crawler: {crawler_class.__name__} for {target_date}")
-                crawler = crawler_class()
-                try:
-                    schedules.extend(crawler.crawl(target_date))
-                except Exception as e:
-                    print(f"Error running {crawler_class.__name__}: {e!s}")
+                units.append(CrawlUnit(crawler_class, start_date + timedelta(days=i)))
         else:
-            print(f"Running crawler: {crawler_class.__name__} at {datetime.today()}")
-            crawler = crawler_class()
-            try:
-                schedules.extend(crawler.crawl())
-            except Exception as e:
-                print(f"Error running {crawler_class.__name__}: {e!s}")
-
+            units.append(CrawlUnit(crawler_class))
+
+    pipeline = pipeline or Pipeline()
+    # 페이지는 처리가 끝나는 순서대로 나오므로 기존과 같은 순서로 다시 정렬한다
+    pages = sorted(pipeline.run(units), key=lambda page: page.index)
+    return [schedule for page in pages for schedule in page.schedules]
+
+
+def run_replay(
+    pipeline: Pipeline, raw_html_dir: str
+) -> list[BreakfastSchedule | LunchSchedule | DinnerSchedule]:
+    """Run archived pages through the pipeline without network access and report throughput."""
+    start = time.perf_counter()
+    pages = sorted(pipeline.stream(archive.replay_pages(raw_html_dir)), key=lambda page: page.index)
+    elapsed = time.perf_counter() - start
+
+    schedules = [schedule for page in pages for schedule in page.schedules]
+    print(
+        f"Replayed {len(pages)} pages ({len(schedules)} schedules) in {elapsed:.2f}s "
+        f"({len(pages) / elapsed if elapsed else 0:.1f} pages/s)"
+    )
     return schedules
 
 
-def normalize_menus(schedules: list[BreakfastSchedule | LunchSchedule | DinnerSchedule]):
-    normalizer = MenuNormalizer()
-
-    for schedule in schedules:
-        schedule.menu.canonical_name = normalizer.normalize(schedule.menu.name)
-
-
-def categorize_menus(schedules: list[BreakfastSchedule | LunchSchedule | DinnerSchedule]):
-    categorizer = MenuCategorizer()
-
-    for schedule in schedules:
-        schedule.menu.category = categorizer.categorize(schedule.menu.canonical_name)
+def run_backfill(
+    pipeline: Pipeline, manifest: BackfillManifest, start: datetime, end: datetime
+) -> int:
+    """Crawl every date from start to end, skipping units the manifest already has.
+
+    Processed schedules are kept in the pipeline's page store, and each unit is checkpointed
+    as soon as it is done. Returns the number of units completed in this run.
+    """
+    units = []
+    for crawler_class in CrawlerRegistry.get_all_crawlers():
+        source = CrawlerRegistry.get_source(crawler_class)
+        if not crawler_class.supports_date:
+            print(f"Skipping {crawler_class.__name__}: past dates are not supported")
+            continue
+        for i in range((end - start).days + 1):
+            target_date = start + timedelta(days=i)
+            if not manifest.is_done(source, target_date):
+                units.append(CrawlUnit(crawler_class, target_date))
+
+    print(f"Backfilling {len(units)} units ({len(manifest)} already done)")
+    completed = 0
+    for page in pipeline.run(units):
+        manifest.mark_done(page.source, page.date)
+        completed += 1
+
+    print(f"Backfill completed: {completed}/{len(units)} units")
+    return completed
+
+
+def resource_fingerprint(confidence_floor: float) -> str:
+    """Fingerprint of the pipeline version, dictionary, settings and model of stored pages."""
+    digest = hashlib.sha256(MenuNormalizer.DICT_PATH.read_bytes())
+    model_version, _ = MenuCategorizer.promoted_model()
+    settings = [
+        PIPELINE_VERSION,
+        MenuNormalizer.THRESHOLD,
+        MenuNormalizer.SHORTLIST_SIZE,
+        MenuNormalizer.DEFAULT_SCORER,
+        MenuNormalizer.COMPILED_VERSION,
+        model_version,
+        MenuCategorizer.ENGINE_VERSION,
+        confidence_floor,
+    ]
+    digest.update(":".join(map(str, settings)).encode())
+    return digest.hexdigest()
 
 
 def main():
     args = parse_args()
-    schedules = run_crawlers(args.days)
-    normalize_menus(schedules)
-    categorize_menus(schedules)
+    BaseCrawler.set_default_session(
+        HttpSession(
+            timeout=(HttpSession.DEFAULT_TIMEOUT[0], args.timeout),
+            cache=None if args.no_cache else ResponseCache(args.cache_dir),
+        )
+    )
+    fingerprint = resource_fingerprint(args.confidence_floor)
+    page_store = PageStore(args.store_dir, fingerprint)
+
+    pipeline = Pipeline(args.workers, args.processes, page_store, args.refresh)
+    if not args.no_normalize_cache and args.normalize_cache:
+        SharedResources.set_normalize_cache_path(args.normalize_cache)
+    SharedResources.set_confidence_floor(args.confidence_floor)
+
+    try:
+        if args.replay:
+            run_replay(pipeline, args.replay)
+        elif args.command == "backfill":
+            manifest = BackfillManifest(args.manifest, fingerprint)
+            run_backfill(pipeline, manifest, args.start, args.end or datetime.today())
+        else:
+            run_crawlers(args.days, pipeline)
+    finally:
+        pipeline.metrics.dump_json(args.metrics_json)
+        if args.metrics_prom:
+            pipeline.metrics.write_prometheus(args.metrics_prom)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,53 @@
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+
+
+class BackfillManifest:
+    """Append-only record of (source, date) units a backfill has completed.
+
+    Each completed unit is written as one JSON line as soon as it finishes, so an interrupted
+    backfill resumes from where it stopped. Units completed with a different dictionary or
+    model (fingerprint) count as not done.
+    """
+
+    DEFAULT_PATH = Path(__file__).parent.parent / ".cache" / "backfill_manifest.jsonl"
+
+    def __init__(self, path: str | Path = DEFAULT_PATH, fingerprint: str = ""):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fingerprint = fingerprint
+        self._lock = threading.Lock()
+        self._done: set[tuple[str, str]] = set()
+
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # 중단되면서 마지막 줄이 잘렸을 수 있다
+                        continue
+                    if entry.get("fingerprint") == fingerprint:
+                        self._done.add((entry["source"], entry["date"]))
+
+    @staticmethod
+    def _key(source: str, date: datetime) -> tuple[str, str]:
+        return source, date.strftime("%Y-%m-%d")
+
+    def is_done(self, source: str, date: datetime) -> bool:
+        return self._key(source, date) in self._done
+
+    def mark_done(self, source: str, date: datetime):
+        key = self._key(source, date)
+        with self._lock:
+            if key in self._done:
+                return
+            self._done.add(key)
+            with self.path.open("a", encoding="utf-8") as f:
+                entry = {"source": key[0], "date": key[1], "fingerprint": self.fingerprint}
+                f.write(json.dumps(entry) + "\n")
+
+    def __len__(self) -> int:
+        return len(self._done)
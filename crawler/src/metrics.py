@@ -0,0 +1,115 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from files import atomic_write
+
+
+class Metrics:
+    """Per-run metrics of the crawl pipeline.
+
+    Keeps latency samples per (stage, source) and counters per (name, source), and dumps
+    them as JSON or as a Prometheus textfile at the end of a run. Safe to use from the
+    pipeline's stage threads.
+    """
+
+    BUCKETS_SECONDS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+    PROMETHEUS_PREFIX = "siksha_crawler"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: dict[tuple[str, str], list[float]] = defaultdict(list)
+        self.counters: dict[tuple[str, str], float] = defaultdict(float)
+
+    def observe(self, stage: str, source: str, seconds: float):
+        with self._lock:
+            self.latencies[(stage, source)].append(seconds)
+
+    def increment(self, name: str, source: str, value: float = 1):
+        with self._lock:
+            self.counters[(name, source)] += value
+
+    @contextmanager
+    def timer(self, stage: str, source: str) -> Iterator[None]:
+        """Record how long the block takes, and count an error if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.increment(f"{stage}_errors", source)
+            raise
+        finally:
+            self.observe(stage, source, time.perf_counter() - start)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            latencies = {key: sorted(samples) for key, samples in self.latencies.items()}
+            counters = dict(self.counters)
+
+        result = {"latency": {}, "counters": {}}
+        for (stage, source), samples in sorted(latencies.items()):
+            result["latency"].setdefault(stage, {})[source] = {
+                "count": len(samples),
+                "sum_ms": round(sum(samples) * 1000, 3),
+                "mean_ms": round(sum(samples) / len(samples) * 1000, 3),
+                "p50_ms": round(samples[len(samples) // 2] * 1000, 3),
+                "p95_ms": round(samples[int(len(samples) * 0.95)] * 1000, 3),
+                "max_ms": round(samples[-1] * 1000, 3),
+                "buckets": {
+                    str(bound): sum(1 for sample in samples if sample <= bound)
+                    for bound in self.BUCKETS_SECONDS
+                },
+            }
+        for (name, source), value in sorted(counters.items()):
+            result["counters"].setdefault(name, {})[source] = value
+        return result
+
+    def dump_json(self, path: str | Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        """Format a sample value without losing precision (counters such as bytes grow large)."""
+        return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+    def write_prometheus(self, path: str | Path):
+        """Write metrics in the Prometheus text format for node_exporter's textfile collector."""
+        prefix = self.PROMETHEUS_PREFIX
+        metrics = self.to_dict()
+        lines = [
+            f"# HELP {prefix}_stage_duration_seconds Time spent per page in each pipeline stage.",
+            f"# TYPE {prefix}_stage_duration_seconds histogram",
+        ]
+        for stage, sources in metrics["latency"].items():
+            for source, histogram in sources.items():
+                labels = f'stage="{stage}",source="{source}"'
+                for bound, count in histogram["buckets"].items():
+                    lines.append(
+                        f'{prefix}_stage_duration_seconds_bucket{{{labels},le="{bound}"}} {count}'
+                    )
+                lines.append(
+                    f'{prefix}_stage_duration_seconds_bucket{{{labels},le="+Inf"}} '
+                    f"{histogram['count']}"
+                )
+                lines.append(
+                    f"{prefix}_stage_duration_seconds_sum{{{labels}}} {histogram['sum_ms'] / 1000}"
+                )
+                lines.append(
+                    f"{prefix}_stage_duration_seconds_count{{{labels}}} {histogram['count']}"
+                )
+
+        for name, sources in metrics["counters"].items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for source, value in sources.items():
+                lines.append(
+                    f'{prefix}_{name}_total{{source="{source}"}} {self._format_value(value)}'
+                )
+
+        # textfile collector가 쓰는 중인 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체한다
+        atomic_write(path, "\n".join(lines) + "\n")
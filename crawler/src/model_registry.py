@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+
+from files import atomic_write
+
+
+class ModelRegistry:
+    """Manifest of the trained menu classifiers and the one promoted for crawling.
+
+    Every model is recorded with its version, the hash of the dictionary rows it was trained
+    on, and its accuracy on held-out dictionary rows, so candidates can be compared before one
+    is promoted. The categorizer loads the promoted model, so picking up a newly
+    trained model does not need a code change.
+    """
+
+    DEFAULT_PATH = Path(__file__).parent / "resources" / "model_registry.json"
+
+    def __init__(self, path: str | Path = DEFAULT_PATH):
+        """
+        Args:
+            path: JSON manifest. Model files are resolved relative to its directory. A missing
+                manifest starts empty; an unreadable one raises instead of being overwritten.
+        """
+        self.path = Path(path)
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {}
+        self.promoted: str | None = data.get("promoted")
+        self.models: dict[str, dict] = {model["version"]: model for model in data.get("models", [])}
+
+    def model_path(self, version: str) -> Path:
+        return self.path.parent / self.models[version]["path"]
+
+    def promoted_model(self) -> tuple[str, Path] | None:
+        """Get the version and file of the promoted model, or None if none is promoted."""
+        if self.promoted not in self.models:
+            return None
+        return self.promoted, self.model_path(self.promoted)
+
+    def register(self, version: str, model_path: str | Path, **details) -> dict:
+        """Record a model, replacing an earlier model of the same version.
+
+        Args:
+            version: Model version, e.g. the training date
+            model_path: joblib file of the model, in the manifest's directory
+            **details: Training set hash, accuracy, ...
+
+        Returns:
+            The recorded entry
+        """
+        self.models[version] = {"version": version, "path": Path(model_path).name, **details}
+        return self.models[version]
+
+    def promote(self, version: str):
+        if version not in self.models:
+            raise KeyError(f"Unknown model version: {version}")
+        self.promoted = version
+
+    def save(self):
+        data = {
+            "promoted": self.promoted,
+            "models": [self.models[version] for version in sorted(self.models)],
+        }
+        atomic_write(self.path, json.dumps(data, ensure_ascii=False, indent=2) + "\n")
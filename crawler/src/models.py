@@ -76,10 +76,13 @@ class CafeteriaCorner(BaseModel):
 class Menu(BaseModel):
     name: str
     canonical_name: str | None = None
+    canonical_parts: list[str] = []  # 복합 메뉴(예: "짜장면,탕수육")의 각 메뉴 정규화 결과
     price: str | None = None
     cafeteria_corner: CafeteriaCorner
     vegetarian: bool = False
     category: Category | None = None
+    # 가능성이 높은 분류 상위 k개와 확률 (사전에서 찾은 분류는 확률 1)
+    category_scores: dict[Category, float] = {}
 
 
 class BaseSchedule(BaseModel):
@@ -0,0 +1,111 @@
+import re
+from collections import defaultdict
+from itertools import chain
+
+import numpy as np
+
+
+class NgramIndex:
+    """Inverted index from character n-grams (bigrams by default) to dictionary entries.
+
+    Used to shortlist the entries worth fuzzy matching a query against, so that matching
+    cost depends on the shortlist size rather than on the size of the whole dictionary.
+    Entries are ranked by how many of their n-grams the query shares, relative to the
+    shorter of the two, since WRatio scores a short entry contained in a long query highly.
+
+    The postings are kept as flat arrays (entry ids of every n-gram, one after another, and
+    the offset of each n-gram's ids), so a compiled index can be loaded without rebuilding.
+    """
+
+    def __init__(
+        self,
+        grams: list[str],
+        offsets: np.ndarray,
+        postings: np.ndarray,
+        gram_counts: np.ndarray,
+        n: int = 2,
+    ):
+        """
+        Args:
+            grams: Indexed n-grams
+            offsets: Start of each n-gram's entry ids in postings, plus the end of the last one
+            postings: Entry ids of every n-gram, one n-gram after another
+            gram_counts: Number of distinct n-grams of each entry
+            n: Length of the character n-grams
+        """
+        self.n = n
+        self.size = len(gram_counts)
+        self.gram_ids = dict(zip(grams, range(len(grams))))
+        self.grams = grams
+        self.offsets = offsets
+        self.postings = postings
+        self.gram_counts = gram_counts
+
+    @classmethod
+    def build(cls, choices: list[str], n: int = 2) -> "NgramIndex":
+        """Index choices, referring to each entry by its position in the list."""
+        postings = defaultdict(list)
+        gram_counts = []
+        for choice_id, choice in enumerate(choices):
+            grams = cls.ngrams(choice, n)
+            gram_counts.append(len(grams))
+            for gram in grams:
+                postings[gram].append(choice_id)
+
+        offsets = np.zeros(len(postings) + 1, dtype=np.int64)
+        np.cumsum([len(ids) for ids in postings.values()], out=offsets[1:])
+        return cls(
+            list(postings),
+            offsets,
+            np.fromiter(chain.from_iterable(postings.values()), dtype=np.int32),
+            np.array(gram_counts, dtype=np.int32),
+            n,
+        )
+
+    @staticmethod
+    def ngrams(text: str, n: int) -> set[str]:
+        """Character n-grams of text without whitespace (the text itself if shorter)."""
+        text = re.sub(r"\s+", "", text)
+        if len(text) < n:
+            return {text} if text else set()
+        return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+    def shortlist(self, query: str, limit: int) -> list[int]:
+        """Get the ids of the entries most likely to match query, in dictionary order.
+
+        Args:
+            query: Menu name to match
+            limit: Maximum number of entries to return
+
+        Returns:
+            Ids of up to limit entries, or of every entry if the query shares no n-gram
+            with the dictionary
+        """
+        grams = self.ngrams(query, self.n)
+        # n글자보다 짧은 항목은 그대로 색인되어 있으므로 질의의 더 짧은 부분 문자열로도 찾는다
+        text = re.sub(r"\s+", "", query)
+        short_grams = {
+            text[i : i + size] for size in range(1, self.n) for i in range(len(text) - size + 1)
+        }
+
+        gram_ids = [self.gram_ids[gram] for gram in grams | short_grams if gram in self.gram_ids]
+        if not gram_ids:
+            return list(range(self.size))
+
+        hits = np.concatenate(
+            [
+                self.postings[self.offsets[gram_id] : self.offsets[gram_id + 1]]
+                for gram_id in gram_ids
+            ]
+        )
+        choice_ids, shared = np.unique(hits, return_counts=True)
+        if len(choice_ids) <= limit:
+            return choice_ids.tolist()
+
+        gram_counts = self.gram_counts[choice_ids]
+        overlap = shared / np.maximum(np.minimum(len(grams), gram_counts), 1)
+        dice = shared / (len(grams) + gram_counts)
+        # 점수가 같으면 사전에서 앞선 항목을 고르고,
+        # extractOne과 같은 결과가 나오도록 사전 순서로 돌려준다
+        ranked = np.lexsort((choice_ids, -dice, -overlap))[:limit]
+        return np.sort(choice_ids[ranked]).tolist()
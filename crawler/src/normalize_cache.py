@@ -0,0 +1,82 @@
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from files import atomic_write
+
+MISSING = object()
+
+
+class NormalizeCache:
+    """LRU cache of normalization results, optionally persisted across runs.
+
+    Results are only valid for the dictionary, settings and matching code they were computed
+    with, so the cache is tied to a fingerprint of them. A store file written with another
+    fingerprint is ignored and replaced on the next save.
+    """
+
+    DEFAULT_PATH = Path(__file__).parent.parent / ".cache" / "normalize_cache.json"
+    DEFAULT_SIZE = 20_000
+
+    def __init__(
+        self, fingerprint: str, path: str | Path | None = None, max_size: int = DEFAULT_SIZE
+    ):
+        """
+        Args:
+            fingerprint: Fingerprint of the dictionary, settings and matching code
+            path: JSON file the cache is loaded from and saved to. If None, cache in memory only.
+            max_size: Maximum number of entries; the least recently used ones are evicted
+        """
+        self.fingerprint = fingerprint
+        self.path = Path(path) if path else None
+        self.max_size = max_size
+        self.entries: OrderedDict[str, str | None] = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        if self.path and max_size > 0:
+            try:
+                with self.path.open(encoding="utf-8") as f:
+                    stored = json.load(f)
+            except (OSError, ValueError):
+                stored = {}
+            if stored.get("fingerprint") == fingerprint:
+                for menu_name, canonical_name in stored.get("entries", {}).items():
+                    self.entries[menu_name] = canonical_name
+                self._evict()
+
+    def get(self, menu_name: str) -> str | object | None:
+        """Get the cached canonical name, or MISSING (None is a cached "no match")."""
+        with self._lock:
+            canonical_name = self.entries.get(menu_name, MISSING)
+            if canonical_name is not MISSING:
+                self.entries.move_to_end(menu_name)
+            return canonical_name
+
+    def put(self, menu_name: str, canonical_name: str | None):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self.entries[menu_name] = canonical_name
+            self.entries.move_to_end(menu_name)
+            self._evict()
+            self._dirty = True
+
+    def _evict(self):
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def save(self):
+        """Write the cache to its store file, if it has one and anything changed."""
+        if not self.path or not self._dirty:
+            return
+
+        with self._lock:
+            data = {"fingerprint": self.fingerprint, "entries": dict(self.entries)}
+            self._dirty = False
+
+        atomic_write(self.path, json.dumps(data, ensure_ascii=False))
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -1,19 +1,177 @@
+import contextlib
+import hashlib
 import json
+import os
 import re
 from pathlib import Path
 
+import numpy as np
 from rapidfuzz import fuzz, process
 
+from compiled_dict import CompiledDict
+from files import atomic_write
+from jamo import decompose
+from ngram_index import NgramIndex
+from normalize_cache import MISSING, NormalizeCache
+
+CPU_COUNT = os.cpu_count() or 1
+
 
 class MenuNormalizer:
     THRESHOLD = 80
+    SHORTLIST_SIZE = 64
+    SCORERS = ("wratio", "jamo")
+    DEFAULT_SCORER = "wratio"
+    COMPOUND_SEPARATORS = re.compile(r"[&,/+]")
+    JAMO_NGRAM = 3
+    DICT_PATH = Path(__file__).parent / "resources" / "menu_dict.jsonl"
+    COMPILED_PATH = Path(__file__).parent.parent / ".cache" / "menu_dict.bin"
+    COMPILED_VERSION = 2
+    # 같은 사전과 설정으로도 정규화 결과가 바뀌는 변경을 할 때마다 올린다
+    CACHE_VERSION = 3
+
+    def __init__(
+        self,
+        cache_path: str | Path | None = None,
+        cache_size: int = NormalizeCache.DEFAULT_SIZE,
+        scorer: str = DEFAULT_SCORER,
+    ):
+        """
+        Args:
+            cache_path: File the normalization results are persisted to across runs.
+                If None, results are only cached in memory.
+            cache_size: Maximum number of cached results (0 disables caching)
+            scorer: "wratio" to match whole syllables, or "jamo" to match names decomposed
+                into jamo, which tolerates spelling variants such as 찌게/찌개
+        """
+        if scorer not in self.SCORERS:
+            raise ValueError(f"Unknown scorer: {scorer} (expected one of {self.SCORERS})")
+        self.scorer = scorer
+
+        dict_bytes = self.DICT_PATH.read_bytes()
+        compiled = self._load_compiled(dict_bytes)
+
+        # 사전 항목과 정규화된 이름은 중복을 제거한 이름 목록의 번호로 저장되어 있다
+        self.choices = compiled.strings("canonical_names")
+        self.mapping_dict = dict(
+            zip(
+                compiled.strings("menu_names"),
+                map(self.choices.__getitem__, compiled.array("canonical_ids").tolist()),
+            )
+        )
+        # 사전에서 검수된 분류 (정규화된 이름 → 분류)
+        self.category_dict = {
+            name: category
+            for name, category in zip(self.choices, compiled.strings("categories"))
+            if category
+        }
+        # 공백과 문장부호를 제거한 키로도 바로 찾을 수 있도록 색인한다
+        self.key_dict = dict(
+            zip(
+                compiled.strings("keys"),
+                map(self.choices.__getitem__, compiled.array("key_canonical_ids").tolist()),
+            )
+        )
+
+        # 퍼지 매칭은 n-gram 색인으로 추린 후보에 대해서만 수행한다
+        # jamo 모드에서는 사전을 미리 자모로 분해해 두고 자모 단위로 색인하고 비교한다
+        self.match_choices = compiled.strings("jamo_choices") if scorer == "jamo" else self.choices
+        self.index = NgramIndex(
+            compiled.strings(f"{scorer}_grams"),
+            compiled.array(f"{scorer}_offsets"),
+            compiled.array(f"{scorer}_postings"),
+            compiled.array(f"{scorer}_gram_counts"),
+            n=self.JAMO_NGRAM if scorer == "jamo" else 2,
+        )
+
+        # 사전이나 설정, 정규화 방식이 바뀌면 이전 결과를 쓰지 않도록 캐시를 fingerprint에 묶는다
+        digest = hashlib.sha256(dict_bytes)
+        digest.update(
+            f"{self.CACHE_VERSION}:{self.THRESHOLD}:{self.SHORTLIST_SIZE}:{scorer}".encode()
+        )
+        self.cache = NormalizeCache(digest.hexdigest(), cache_path, cache_size)
+
+    @classmethod
+    def _source_hash(cls, dict_bytes: bytes) -> str:
+        digest = hashlib.sha256(dict_bytes)
+        digest.update(f"{cls.COMPILED_VERSION}:{cls.JAMO_NGRAM}".encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def _load_compiled(cls, dict_bytes: bytes) -> CompiledDict:
+        """Load the compiled dictionary, compiling it again if menu_dict.jsonl has changed."""
+        source_hash = cls._source_hash(dict_bytes)
+        compiled = CompiledDict.load(cls.COMPILED_PATH, source_hash)
+        if compiled is None:
+            data = cls._compile(dict_bytes)
+            with contextlib.suppress(OSError):
+                atomic_write(cls.COMPILED_PATH, data)
+            compiled = CompiledDict(data)
+        return compiled
+
+    @classmethod
+    def _compile(cls, dict_bytes: bytes) -> bytes:
+        mapping_dict, categories = {}, {}
+        for line in dict_bytes.decode("utf-8").splitlines():
+            if line.strip():
+                item = json.loads(line)
+                mapping_dict[item["menu_name"]] = item["canonical_name"]
+                # 분류가 엇갈리면 정규화된 이름 자신의 항목에 붙은 분류를 따른다
+                if item.get("category") and (
+                    item["canonical_name"] not in categories
+                    or item["menu_name"] == item["canonical_name"]
+                ):
+                    categories[item["canonical_name"]] = item["category"]
+
+        canonical_names = list(dict.fromkeys(mapping_dict.values()))
+        canonical_ids = {name: canonical_id for canonical_id, name in enumerate(canonical_names)}
+        key_dict = {}
+        for menu_name, canonical_name in mapping_dict.items():
+            key_dict.setdefault(cls._make_key(menu_name), canonical_name)
 
-    def __init__(self):
-        mapping_path = Path(__file__).parent / "resources" / "menu_dict.jsonl"
-        self.mapping_dict = {}
-        for line in mapping_path.open("r", encoding="utf-8"):
-            item = json.loads(line)
-            self.mapping_dict[item["menu_name"]] = item["canonical_name"]
+        jamo_choices = [decompose(name) for name in canonical_names]
+        indexes = {
+            "wratio": NgramIndex.build(canonical_names),
+            "jamo": NgramIndex.build(jamo_choices, n=cls.JAMO_NGRAM),
+        }
+
+        strings = {
+            "menu_names": list(mapping_dict),
+            "canonical_names": canonical_names,
+            "categories": [categories.get(name, "") for name in canonical_names],
+            "keys": list(key_dict),
+            "jamo_choices": jamo_choices,
+        }
+        arrays = {
+            "canonical_ids": np.array(
+                [canonical_ids[name] for name in mapping_dict.values()], dtype=np.int32
+            ),
+            "key_canonical_ids": np.array(
+                [canonical_ids[name] for name in key_dict.values()], dtype=np.int32
+            ),
+        }
+        for scorer, index in indexes.items():
+            strings[f"{scorer}_grams"] = index.grams
+            arrays[f"{scorer}_offsets"] = index.offsets
+            arrays[f"{scorer}_postings"] = index.postings
+            arrays[f"{scorer}_gram_counts"] = index.gram_counts
+
+        return CompiledDict.dumps(cls._source_hash(dict_bytes), strings, arrays)
+
+    @classmethod
+    def compile(cls) -> Path:
+        """Compile menu_dict.jsonl into the binary artifact loaded at startup.
+
+        Returns:
+            Path of the compiled artifact
+        """
+        atomic_write(cls.COMPILED_PATH, cls._compile(cls.DICT_PATH.read_bytes()))
+        return cls.COMPILED_PATH
+
+    @staticmethod
+    def _make_key(menu_name: str) -> str:
+        """Drop whitespace and punctuation so spacing variants map to the same key."""
+        return re.sub(r"[\W_]+", "", menu_name)
 
     def _rule_based_normalization(self, menu_name: str) -> str | None:
         """Normalize menu name using rule-based approach."""
@@ -21,13 +179,157 @@ class MenuNormalizer:
         removed_brackets = re.sub(r"\[.*?\]", "", removed_parentheses)
         return removed_brackets
 
-    def _fuzzy_matching(self, menu_name: str) -> tuple[str, float]:
-        """Normalize menu name using fuzzy matching."""
-        best, score, _ = process.extractOne(menu_name, self.mapping_dict, scorer=fuzz.WRatio)
-        return best, score
+    def _exact_matching(self, menu_name: str) -> str | None:
+        """Look up menu name in the dictionary as is, then by its normalized key."""
+        if menu_name in self.mapping_dict:
+            return self.mapping_dict[menu_name]
+        return self.key_dict.get(self._make_key(menu_name))
+
+    def _prepare_query(self, menu_name: str) -> str:
+        """Convert menu name into the space the scorer compares in."""
+        return decompose(menu_name) if self.scorer == "jamo" else menu_name
+
+    def _fuzzy_matching(self, menu_name: str) -> tuple[str | None, float]:
+        """Normalize menu name using fuzzy matching.
+
+        Candidates scoring below THRESHOLD are cut off early, so (None, 0) means no match.
+        """
+        query = self._prepare_query(menu_name)
+        return self._best_match(query, self.index.shortlist(query, self.SHORTLIST_SIZE))
+
+    def _best_match(self, query: str, choice_ids: list[int]) -> tuple[str | None, float]:
+        result = process.extractOne(
+            query,
+            [self.match_choices[choice_id] for choice_id in choice_ids],
+            scorer=fuzz.WRatio,
+            score_cutoff=self.THRESHOLD,
+        )
+        if result is None:
+            return None, 0
+        _, score, position = result
+        return self.choices[choice_ids[position]], score
+
+    def _fuzzy_matching_many(self, menu_names: list[str]) -> list[str | None]:
+        """Fuzzy match many menu names, scoring all of their candidates in one cdist call."""
+        queries = [self._prepare_query(menu_name) for menu_name in menu_names]
+        shortlists = [self.index.shortlist(query, self.SHORTLIST_SIZE) for query in queries]
+        choice_ids = sorted(set().union(*shortlists))
+
+        # 질의마다 후보가 크게 달라 합친 행렬이 지나치게 커지면 질의별로 매칭하는 편이 빠르다
+        if len(queries) * len(choice_ids) > CPU_COUNT * sum(map(len, shortlists)):
+            matches = [self._best_match(q, ids) for q, ids in zip(queries, shortlists)]
+            return [best if score > self.THRESHOLD else None for best, score in matches]
+
+        # 모든 질의의 후보를 합쳐 한 번에 점수를 매긴 뒤, 각 질의의 후보가 아닌 점수는 버린다
+        columns = {choice_id: column for column, choice_id in enumerate(choice_ids)}
+        scores = process.cdist(
+            queries,
+            [self.match_choices[choice_id] for choice_id in choice_ids],
+            scorer=fuzz.WRatio,
+            dtype="float64",
+            workers=-1,
+            score_cutoff=self.THRESHOLD,
+        )
+        mask = np.zeros(scores.shape, dtype=bool)
+        for row, shortlist in enumerate(shortlists):
+            mask[row, [columns[choice_id] for choice_id in shortlist]] = True
+        scores[~mask] = 0
+
+        best_columns = scores.argmax(axis=1)
+        return [
+            self.choices[choice_ids[column]] if row[column] > self.THRESHOLD else None
+            for row, column in zip(scores, best_columns, strict=True)
+        ]
 
     def normalize(self, menu_name: str) -> str | None:
         """Normalize menu name using rapidfuzz."""
+        cached = self.cache.get(menu_name)
+        if cached is not MISSING:
+            return cached
+
         rule_based_normalized_menu_name = self._rule_based_normalization(menu_name)
-        best, score = self._fuzzy_matching(rule_based_normalized_menu_name)
-        return best if score > self.THRESHOLD else None
+        canonical_name = self._exact_matching(rule_based_normalized_menu_name)
+        if canonical_name is None:
+            best, score = self._fuzzy_matching(rule_based_normalized_menu_name)
+            canonical_name = best if score > self.THRESHOLD else None
+
+        self.cache.put(menu_name, canonical_name)
+        return canonical_name
+
+    def normalize_many(self, menu_names: list[str]) -> list[str | None]:
+        """Normalize many menu names at once.
+
+        Duplicate names are normalized once, and names not found in the dictionary are scored
+        against their shortlisted candidates in a single multi-threaded rapidfuzz cdist call.
+
+        Args:
+            menu_names: Menu names to normalize
+
+        Returns:
+            Canonical names in the same order as menu_names (None if no match)
+        """
+        results = {}
+        unique_names = []
+        for name in dict.fromkeys(menu_names):
+            cached = self.cache.get(name)
+            if cached is MISSING:
+                unique_names.append(name)
+            else:
+                results[name] = cached
+
+        cleaned_names = {name: self._rule_based_normalization(name) for name in unique_names}
+
+        for name, cleaned_name in cleaned_names.items():
+            exact = self._exact_matching(cleaned_name)
+            if exact is not None:
+                results[name] = exact
+
+        queries = list(
+            dict.fromkeys(cleaned_names[name] for name in unique_names if name not in results)
+        )
+        if queries:
+            matches = dict(zip(queries, self._fuzzy_matching_many(queries), strict=True))
+            for name in unique_names:
+                if name not in results:
+                    results[name] = matches[cleaned_names[name]]
+
+        for name in unique_names:
+            self.cache.put(name, results[name])
+        return [results[name] for name in menu_names]
+
+    def split_compound(self, menu_name: str) -> list[str]:
+        """Split a compound menu name such as "짜장면,탕수육" into its dishes.
+
+        Names found in the dictionary as a whole, and names without a separator, are kept as
+        a single part.
+        """
+        cleaned_name = self._rule_based_normalization(menu_name)
+        if self._exact_matching(cleaned_name) is not None:
+            return [menu_name]
+
+        parts = [part.strip() for part in self.COMPOUND_SEPARATORS.split(cleaned_name)]
+        parts = [part for part in parts if part]
+        return parts if len(parts) > 1 else [menu_name]
+
+    def normalize_compound_many(self, menu_names: list[str]) -> list[list[str]]:
+        """Normalize every dish of many, possibly compound, menu names at once.
+
+        The parts of all names are normalized in one batch, so a dish shared by several
+        menus is matched only once.
+
+        Args:
+            menu_names: Menu names to normalize
+
+        Returns:
+            Canonical names of the matched parts of each menu name, in order
+        """
+        parts = [self.split_compound(menu_name) for menu_name in menu_names]
+        canonical_names = iter(self.normalize_many([part for names in parts for part in names]))
+        return [
+            [name for name in (next(canonical_names) for _ in names) if name is not None]
+            for names in parts
+        ]
+
+    def save_cache(self):
+        """Persist cached normalization results, if the cache has a store file."""
+        self.cache.save()
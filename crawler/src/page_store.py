@@ -0,0 +1,70 @@
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+
+from files import atomic_write
+from models import BaseSchedule, BreakfastSchedule, DinnerSchedule, LunchSchedule, MealType
+
+SCHEDULE_CLASSES: dict[MealType, type[BaseSchedule]] = {
+    MealType.BR: BreakfastSchedule,
+    MealType.LU: LunchSchedule,
+    MealType.DN: DinnerSchedule,
+}
+
+
+class PageStore:
+    """Persisted store of processed pages per (source, date).
+
+    Each entry keeps the hash of the page HTML together with the normalized and categorized
+    schedules built from it, so a byte-identical page can skip parse/normalize/categorize.
+    Entries built with a different dictionary or model (fingerprint) are treated as missing.
+    """
+
+    DEFAULT_DIR = Path(__file__).parent.parent / ".cache" / "pages"
+
+    def __init__(self, store_dir: str | Path = DEFAULT_DIR, fingerprint: str = ""):
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.fingerprint = fingerprint
+
+    @staticmethod
+    def hash_html(html_content: str) -> str:
+        return hashlib.sha256(html_content.encode("utf-8")).hexdigest()
+
+    def _path(self, source: str, date: datetime) -> Path:
+        return self.store_dir / f"{source}_{date.strftime('%Y_%m_%d')}.json"
+
+    def load(
+        self, source: str, date: datetime, html_content: str
+    ) -> list[BreakfastSchedule | LunchSchedule | DinnerSchedule] | None:
+        """Get the stored schedules if the page is unchanged since it was last processed."""
+        try:
+            with self._path(source, date).open(encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        html_hash = self.hash_html(html_content)
+        if entry.get("fingerprint") != self.fingerprint or entry.get("html_hash") != html_hash:
+            return None
+
+        return [
+            SCHEDULE_CLASSES[MealType(item["meal_type"])].model_validate(item)
+            for item in entry["schedules"]
+        ]
+
+    def save(
+        self,
+        source: str,
+        date: datetime,
+        html_content: str,
+        schedules: list[BreakfastSchedule | LunchSchedule | DinnerSchedule],
+    ):
+        """Store the processed schedules of a page."""
+        entry = {
+            "fingerprint": self.fingerprint,
+            "html_hash": self.hash_html(html_content),
+            "schedules": [schedule.model_dump(mode="json") for schedule in schedules],
+        }
+        atomic_write(self._path(source, date), json.dumps(entry, ensure_ascii=False))
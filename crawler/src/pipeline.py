@@ -0,0 +1,253 @@
+import contextlib
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+
+from categorizer import MenuCategorizer
+from executor import DEFAULT_PROCESSES, CrawlExecutor, CrawlUnit, ParseJob, parse_job
+from metrics import Metrics
+from models import BreakfastSchedule, DinnerSchedule, LunchSchedule
+from normalizer import MenuNormalizer
+from page_store import PageStore
+from registry import CrawlerRegistry
+from resolver import MenuResolver
+from shared import SharedResources
+
+_DONE = object()
+
+
+@dataclass
+class Page:
+    """A page flowing through the pipeline, from raw HTML to categorized schedules."""
+
+    source: str
+    date: datetime
+    html_content: str
+    index: int = 0
+    schedules: list[BreakfastSchedule | LunchSchedule | DinnerSchedule] | None = None
+    unchanged: bool = False
+
+
+class Pipeline:
+    """Streaming crawl → parse → normalize → categorize pipeline.
+
+    Every stage runs in its own thread and hands pages to the next stage through a bounded
+    queue, so the first pages are normalized and categorized while later ones are still being
+    fetched, and memory stays flat however many pages go through.
+    """
+
+    QUEUE_SIZE = 16
+
+    def __init__(
+        self,
+        workers: int = CrawlExecutor.DEFAULT_WORKERS,
+        processes: int = DEFAULT_PROCESSES,
+        page_store: PageStore | None = None,
+        refresh: bool = False,
+    ):
+        """
+        Args:
+            workers: Number of concurrent fetch workers
+            processes: Number of processes used to parse pages
+            page_store: Store of processed pages, reused when a page has not changed
+            refresh: If True, reprocess every page even if it is unchanged
+        """
+        self.executor = CrawlExecutor(workers)
+        self.processes = processes
+        self.page_store = page_store
+        self.refresh = refresh
+        self.normalizer: MenuNormalizer | None = None
+        self.categorizer: MenuCategorizer | None = None
+        self.resolver: MenuResolver | None = None
+        self.metrics = Metrics()
+        self._errors: list[Exception] = []
+
+    def run(self, units: Iterable[CrawlUnit]) -> Iterator[Page]:
+        """Fetch and process every unit, yielding pages as soon as they are categorized."""
+        return self.stream(self.fetch_pages(units))
+
+    def fetch_pages(self, units: Iterable[CrawlUnit]) -> Iterator[Page]:
+        """Fetch the pages of units concurrently, yielding them as they arrive."""
+        units = list(units)
+        for index, html_content in self.executor.as_completed(self._fetch, units):
+            if html_content is None:
+                continue
+            crawler_class, target_date = units[index]
+            yield Page(
+                source=CrawlerRegistry.get_source(crawler_class),
+                # 날짜 파라미터를 지원하지 않는 크롤러는 실행한 날짜의 식단으로 취급한다
+                date=target_date or datetime.today(),
+                html_content=html_content,
+                index=index,
+            )
+
+    def stream(self, pages: Iterable[Page]) -> Iterator[Page]:
+        """Parse, normalize and categorize pages, yielding each one when it is done.
+
+        Pages are yielded in completion order; use Page.index to restore the input order.
+        """
+        fetched, parsed, normalized, done = (queue.Queue(self.QUEUE_SIZE) for _ in range(4))
+        self._errors = []
+
+        parse_pool = (
+            ProcessPoolExecutor(max_workers=self.processes)
+            if self.processes > 1
+            else contextlib.nullcontext()
+        )
+        with parse_pool as pool:
+            threads = [
+                threading.Thread(target=self._feed, args=(pages, fetched), daemon=True),
+                *self._start_stage(
+                    lambda page: self._parse(page, pool),
+                    fetched,
+                    parsed,
+                    threads=max(1, self.processes),
+                ),
+                *self._start_stage(
+                    self._normalize, parsed, normalized, setup=self._load_normalizer
+                ),
+                *self._start_stage(
+                    self._categorize, normalized, done, setup=self._load_categorizer
+                ),
+            ]
+            threads[0].start()
+
+            while (page := done.get()) is not _DONE:
+                yield page
+
+            for thread in threads:
+                thread.join()
+
+        if self.normalizer:
+            self.normalizer.save_cache()
+        if self._errors:
+            raise self._errors[0]
+
+    def _start_stage(
+        self,
+        func: Callable[[Page], Page | None],
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+        threads: int = 1,
+        setup: Callable[[], None] | None = None,
+    ) -> list[threading.Thread]:
+        """Run func over the pages of inbox on worker threads and put the results in outbox."""
+
+        def work():
+            try:
+                if setup:
+                    setup()
+            except Exception as e:
+                self._errors.append(e)
+
+            while (page := inbox.get()) is not _DONE:
+                if self._errors:
+                    # 파이프라인이 실패했으므로 앞 단계가 막히지 않도록 남은 페이지를 버린다
+                    continue
+                try:
+                    result = func(page)
+                except Exception as e:
+                    print(f"Error processing {page.source} for {page.date.date()}: {e!s}")
+                    continue
+                if result is not None:
+                    outbox.put(result)
+            # 같은 단계의 다른 스레드도 종료할 수 있도록 종료 신호를 되돌려 놓는다
+            inbox.put(_DONE)
+
+        workers = [threading.Thread(target=work, daemon=True) for _ in range(threads)]
+
+        def close():
+            for worker in workers:
+                worker.join()
+            outbox.put(_DONE)
+
+        stage_threads = [*workers, threading.Thread(target=close, daemon=True)]
+        for thread in stage_threads:
+            thread.start()
+        return stage_threads
+
+    def _feed(self, pages: Iterable[Page], outbox: queue.Queue):
+        try:
+            for page in pages:
+                outbox.put(page)
+        except Exception as e:
+            self._errors.append(e)
+        finally:
+            outbox.put(_DONE)
+
+    def _fetch(self, unit: CrawlUnit) -> str | None:
+        crawler_class, target_date = unit
+        if target_date:
+            print(f"Running crawler: {crawler_class.__name__} for {target_date}")
+        else:
+            print(f"Running crawler: {crawler_class.__name__} at {datetime.today()}")
+
+        source = CrawlerRegistry.get_source(crawler_class)
+        try:
+            with self.metrics.timer("fetch", source):
+                html_content = crawler_class().fetch_html(target_date)
+        except Exception as e:
+            print(f"Error running {crawler_class.__name__}: {e!s}")
+            return None
+
+        self.metrics.increment("fetched_bytes", source, len(html_content.encode("utf-8")))
+        return html_content
+
+    def _parse(self, page: Page, pool: Executor | None) -> Page | None:
+        if self.page_store and not self.refresh:
+            stored = self.page_store.load(page.source, page.date, page.html_content)
+            if stored is not None:
+                print(f"Unchanged page: {page.source} for {page.date.date()}")
+                self.metrics.increment("unchanged_pages", page.source)
+                page.schedules = stored
+                page.unchanged = True
+                return page
+
+        job = ParseJob(page.source, page.html_content, page.date)
+        with self.metrics.timer("parse", page.source):
+            page.schedules = pool.submit(parse_job, job).result() if pool else parse_job(job)
+
+        if page.schedules is None:
+            self.metrics.increment("parse_errors", page.source)
+            return None
+        return page
+
+    def _load_normalizer(self):
+        with self.metrics.timer("load", "normalizer"):
+            self.normalizer = SharedResources.get_normalizer()
+
+    def _normalize(self, page: Page) -> Page:
+        if not page.unchanged:
+            with self.metrics.timer("normalize", page.source):
+                menu_names = [schedule.menu.name for schedule in page.schedules]
+                canonical_parts = self.normalizer.normalize_compound_many(menu_names)
+                for schedule, parts in zip(page.schedules, canonical_parts, strict=True):
+                    # 복합 메뉴는 처음 나오는 메뉴를 대표 메뉴로 삼는다
+                    schedule.menu.canonical_parts = parts
+                    schedule.menu.canonical_name = parts[0] if parts else None
+        return page
+
+    def _load_categorizer(self):
+        with self.metrics.timer("load", "categorizer"):
+            self.categorizer = SharedResources.get_categorizer()
+        # 사전에 분류가 있는 메뉴는 모델 대신 사전의 분류를 쓴다
+        self.resolver = SharedResources.get_resolver()
+
+    def _categorize(self, page: Page) -> Page:
+        if not page.unchanged:
+            with self.metrics.timer("categorize", page.source):
+                scored = self.resolver.score_many(
+                    [schedule.menu.canonical_name for schedule in page.schedules]
+                )
+                for schedule, (category, scores) in zip(page.schedules, scored, strict=True):
+                    schedule.menu.category = category
+                    schedule.menu.category_scores = dict(scores)
+            if self.page_store:
+                self.page_store.save(page.source, page.date, page.html_content, page.schedules)
+
+        self.metrics.increment("pages", page.source)
+        self.metrics.increment("schedules", page.source, len(page.schedules))
+        return page
@@ -22,6 +22,14 @@ class CrawlerRegistry:
             raise ValueError(f"No crawler registered for source: {source}")
         return cls._crawlers[source]
 
+    @classmethod
+    def get_source(cls, crawler_class: type[BaseCrawler]) -> str:
+        """Get the source name a crawler class is registered under."""
+        for source, registered_class in cls._crawlers.items():
+            if registered_class is crawler_class:
+                return source
+        raise ValueError(f"Crawler not registered: {crawler_class.__name__}")
+
     @classmethod
     def get_all_crawlers(cls) -> list[type[BaseCrawler]]:
         """Get all registered crawler classes."""
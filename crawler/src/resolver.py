@@ -0,0 +1,128 @@
+from dataclasses import dataclass
+
+from categorizer import MenuCategorizer
+from models import Category
+from normalizer import MenuNormalizer
+
+
+@dataclass
+class ResolvedMenu:
+    """Canonical names and category of a crawled menu name."""
+
+    canonical_parts: list[str]
+    category: Category | None
+    # 가능성이 높은 순서의 (분류, 확률) (사전에서 찾은 분류는 모델로 점수를 매기지 않으면 확률 1)
+    scores: list[tuple[Category, float]]
+
+    @property
+    def canonical_name(self) -> str | None:
+        """Canonical name of the first dish, which stands for the whole menu."""
+        return self.canonical_parts[0] if self.canonical_parts else None
+
+    @property
+    def confidence(self) -> float | None:
+        """Probability of the chosen category (of the most likely one if it is not scored)."""
+        if not self.scores:
+            return None
+        return dict(self.scores).get(self.category, self.scores[0][1])
+
+
+class MenuResolver:
+    """Resolve menu names to canonical names and categories, dictionary first.
+
+    Every dictionary entry carries a reviewed category, so a canonical name found in the
+    dictionary takes its category from there. Only the remaining names are categorized by
+    the model, in a single batch.
+    """
+
+    def __init__(self, normalizer: MenuNormalizer, categorizer: MenuCategorizer):
+        self.normalizer = normalizer
+        self.categorizer = categorizer
+
+    def categorize_many(self, canonical_names: list[str | None]) -> list[Category | None]:
+        """Categorize canonical names, using the model only for names without a reviewed category.
+
+        Args:
+            canonical_names: Canonical menu names (None for menus that could not be normalized)
+
+        Returns:
+            Categories in the same order as canonical_names (None if not categorized)
+        """
+        return [category for category, _ in self.score_many(canonical_names, k=1)]
+
+    def score_many(
+        self,
+        canonical_names: list[str | None],
+        k: int = MenuCategorizer.DEFAULT_TOP_K,
+        score_labeled: bool = False,
+    ) -> list[tuple[Category | None, list[tuple[Category, float]]]]:
+        """Categorize canonical names along with the k most likely categories and their scores.
+
+        A reviewed category always stays the category. By default it is scored 1.0 and only
+        names without one go to the model. With score_labeled, the model scores every name in
+        one batch, and a reviewed category outside the k most likely is added with its
+        probability, so the data tools can find labels the model disagrees with.
+
+        Args:
+            canonical_names: Canonical menu names (None for menus that could not be normalized)
+            k: Number of scored categories per name
+            score_labeled: Also score names with a reviewed category with the model
+
+        Returns:
+            (category, [(category, probability), ...]) in the same order as canonical_names
+        """
+        labels = [
+            self.normalizer.category_dict.get(name) if name else None for name in canonical_names
+        ]
+        categories = [
+            MenuCategorizer.to_category(name, label) if label else None
+            for name, label in zip(canonical_names, labels)
+        ]
+        to_score = [
+            name
+            for name, label in zip(canonical_names, labels)
+            if name and (score_labeled or not label)
+        ]
+        include = {
+            name: category for name, category in zip(canonical_names, categories) if category
+        }
+        predicted = iter(self.categorizer.categorize_top_k(to_score, k, include=include))
+
+        results = []
+        for name, label, category in zip(canonical_names, labels, categories):
+            if label and score_labeled:
+                scores = next(predicted)
+                results.append((category, scores if category else []))
+            elif label:
+                results.append((category, [(category, 1.0)] if category else []))
+            elif name:
+                scores = next(predicted)
+                results.append((self.categorizer.select(scores), scores))
+            else:
+                results.append((None, []))
+        return results
+
+    def resolve_many(
+        self,
+        menu_names: list[str],
+        k: int = MenuCategorizer.DEFAULT_TOP_K,
+        score_labeled: bool = False,
+    ) -> list[ResolvedMenu]:
+        """Normalize and categorize many, possibly compound, menu names.
+
+        Args:
+            menu_names: Menu names as crawled
+            k: Number of scored categories per menu
+            score_labeled: Also score menus with a reviewed category with the model
+
+        Returns:
+            Resolved menus in the same order as menu_names
+        """
+        canonical_parts = self.normalizer.normalize_compound_many(menu_names)
+        scored = self.score_many(
+            [parts[0] if parts else None for parts in canonical_parts], k, score_labeled
+        )
+        return [
+            ResolvedMenu(parts, category, scores)
+            for parts, (category, scores) in zip(canonical_parts, scored)
+        ]
@@ -0,0 +1,90 @@
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import ClassVar, TypeVar
+
+from categorizer import MenuCategorizer
+from normalizer import MenuNormalizer
+from resolver import MenuResolver
+
+T = TypeVar("T")
+
+
+class SharedResources:
+    """Normalizer and categorizer shared by everything in the process.
+
+    Loading the dictionary and the classifier is the slowest part of a short run, so each is
+    loaded on first use, once, and the same warm instance is handed to every caller. Each
+    resource has its own lock, so the two can be loaded concurrently from different threads.
+    """
+
+    _instances: ClassVar[dict[str, object]] = {}
+    _locks: ClassVar[dict[str, threading.Lock]] = {
+        "normalizer": threading.Lock(),
+        "categorizer": threading.Lock(),
+    }
+    _load_seconds: ClassVar[dict[str, float]] = {}
+    # 정규화 결과를 실행 간에 재사용할 파일 (None이면 메모리에만 캐시)
+    _normalize_cache_path: ClassVar[Path | None] = None
+    # 이 확률보다 낮은 분류 결과는 Category.ETC_UNKNOWN으로 둔다
+    _confidence_floor: ClassVar[float] = 0.0
+
+    @classmethod
+    def get_normalizer(cls) -> MenuNormalizer:
+        return cls._get("normalizer", lambda: MenuNormalizer(cache_path=cls._normalize_cache_path))
+
+    @classmethod
+    def get_categorizer(cls) -> MenuCategorizer:
+        return cls._get("categorizer", lambda: MenuCategorizer(cls._confidence_floor))
+
+    @classmethod
+    def get_resolver(cls) -> MenuResolver:
+        """Resolver over the shared normalizer and categorizer, loading them if needed."""
+        return MenuResolver(cls.get_normalizer(), cls.get_categorizer())
+
+    @classmethod
+    def _get(cls, name: str, load: Callable[[], T]) -> T:
+        instance = cls._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with cls._locks[name]:
+            # 다른 스레드가 기다리는 동안 이미 불러왔을 수 있다
+            instance = cls._instances.get(name)
+            if instance is None:
+                start = time.perf_counter()
+                instance = load()
+                cls._load_seconds[name] = time.perf_counter() - start
+                cls._instances[name] = instance
+                print(f"Loaded {name} in {cls._load_seconds[name] * 1000:.1f}ms")
+            return instance
+
+    @classmethod
+    def set_normalize_cache_path(cls, path: str | Path | None):
+        """Persist normalization results to path. Drops the normalizer if it is already loaded."""
+        with cls._locks["normalizer"]:
+            cls._normalize_cache_path = Path(path) if path else None
+            cls._instances.pop("normalizer", None)
+
+    @classmethod
+    def set_confidence_floor(cls, confidence_floor: float):
+        """Report categories less likely than confidence_floor as Category.ETC_UNKNOWN."""
+        with cls._locks["categorizer"]:
+            cls._confidence_floor = confidence_floor
+            categorizer = cls._instances.get("categorizer")
+            if categorizer is not None:
+                categorizer.confidence_floor = confidence_floor
+
+    @classmethod
+    def load_times(cls) -> dict[str, float]:
+        """Seconds it took to load each resource loaded so far."""
+        return dict(cls._load_seconds)
+
+    @classmethod
+    def reset(cls):
+        """Drop every loaded resource, so the next call loads it again."""
+        for name, lock in cls._locks.items():
+            with lock:
+                cls._instances.pop(name, None)
+                cls._load_seconds.pop(name, None)
@@ -0,0 +1,328 @@
+"""파서, Normalizer, Categorizer 성능 측정 도구.
+
+back_test_data의 아카이브된 HTML로 각 단계의 소요 시간을 측정하고 JSON으로 출력합니다.
+커밋 간 비교는 `--output`으로 결과를 저장한 뒤 `--compare`로 이전 결과를 지정합니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+import pandas as pd
+
+CRAWLER_ROOT = pathlib.Path(__file__).parent.parent
+sys.path[:0] = [str(CRAWLER_ROOT), str(CRAWLER_ROOT / "src")]
+
+from src import archive, jamo  # noqa: E402
+from src.categorizer import MenuCategorizer  # noqa: E402
+from src.normalizer import MenuNormalizer  # noqa: E402
+from src.registry import CrawlerRegistry  # noqa: E402
+from tests.update_dict import absorb_rows, fit_full_model, fit_incremental_model  # noqa: E402
+
+DEFAULT_RAW_HTML_DIR = pathlib.Path(__file__).parent / "back_test_data" / "raw_html"
+
+
+def timed(func: Callable[..., object], *args) -> tuple[float, object]:
+    """Run func(*args) and return (elapsed milliseconds, result)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def summarize(samples_ms: list[float]) -> dict[str, float]:
+    samples = sorted(samples_ms)
+    return {
+        "count": len(samples),
+        "total_ms": round(sum(samples), 3),
+        "mean_ms": round(statistics.fmean(samples), 4) if samples else 0.0,
+        "p50_ms": round(samples[len(samples) // 2], 4) if samples else 0.0,
+        "p95_ms": round(samples[int(len(samples) * 0.95)], 4) if samples else 0.0,
+    }
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    """Smallest elapsed milliseconds of func over repeat runs."""
+    return min(timed(func)[0] for _ in range(repeat))
+
+
+def load_pages(raw_html_dir: pathlib.Path, sources: list[str]) -> list[tuple[str, str, datetime]]:
+    pages = []
+    for source in sources:
+        for file_name, html_date in archive.get_html_files(str(raw_html_dir), source):
+            html_content = (raw_html_dir / file_name).read_text(encoding="utf-8")
+            pages.append((source, html_content, html_date))
+    return pages
+
+
+def bench_load(repeat: int) -> dict:
+    return {
+        "dictionary_ms": round(best_of(repeat, MenuNormalizer), 3),
+        "model_ms": round(best_of(repeat, MenuCategorizer), 3),
+    }
+
+
+def bench_parse(pages: list[tuple[str, str, datetime]]) -> tuple[dict, list[str]]:
+    results = {}
+    menu_names = []
+    for source in dict.fromkeys(source for source, _, _ in pages):
+        crawler = CrawlerRegistry.get_crawler(source)()
+        samples = []
+        for page_source, html_content, html_date in pages:
+            if page_source != source:
+                continue
+            elapsed, schedules = timed(crawler.parse, html_content, html_date)
+            samples.append(elapsed)
+            menu_names.extend(schedule.menu.name for schedule in schedules)
+        results[source] = summarize(samples)
+    return results, menu_names
+
+
+def bench_normalize(normalizer: MenuNormalizer, menu_names: list[str], repeat: int) -> dict:
+    # 캐시된 결과를 다시 읽는 시간은 따로 측정한다 (normalizer는 캐시 없이 생성됨)
+    cached = MenuNormalizer()
+    cached.normalize_many(menu_names)
+    samples = [timed(normalizer.normalize, name)[0] for name in menu_names]
+    return {
+        "names": len(menu_names),
+        "unique_names": len(set(menu_names)),
+        "per_name": summarize(samples),
+        "bulk_ms": round(
+            best_of(repeat, lambda: [normalizer.normalize(name) for name in menu_names]), 3
+        ),
+        "batch_ms": round(best_of(repeat, lambda: normalizer.normalize_many(menu_names)), 3),
+        "cached_ms": round(best_of(repeat, lambda: cached.normalize_many(menu_names)), 3),
+    }
+
+
+# 자주 보이는 표기 변형 (찌게/찌개, 볶은/볶음, 까스/가스)
+RESPELLINGS = {"ㅐ": "ㅔ", "ㅔ": "ㅐ", "ㅁ": "ㄴ", "ㄲ": "ㄱ", "ㄱ": "ㄲ"}
+
+
+def respell(name: str) -> str | None:
+    """Change the first respellable jamo of name, e.g. "김치찌개" -> "김치찌게"."""
+    for i, char in enumerate(name):
+        code = ord(char) - jamo.HANGUL_BASE
+        if not 0 <= code <= jamo.HANGUL_LAST - jamo.HANGUL_BASE:
+            continue
+        parts = [code // 588, code // 28 % 21, code % 28]
+        tables = [jamo.CHOSEONG, jamo.JUNGSEONG, jamo.JONGSEONG]
+        for position, table in enumerate(tables):
+            replacement = RESPELLINGS.get(table[parts[position]])
+            if replacement and replacement in table:
+                parts[position] = table.index(replacement)
+                respelled = chr(jamo.HANGUL_BASE + parts[0] * 588 + parts[1] * 28 + parts[2])
+                return name[:i] + respelled + name[i + 1 :]
+    return None
+
+
+def respelled_variants(normalizer: MenuNormalizer) -> dict[str, str]:
+    """Respelled dictionary entries that are not in the dictionary, with their entry."""
+    variants = {}
+    for canonical_name in normalizer.choices:
+        variant = respell(canonical_name)
+        if variant and variant not in normalizer.mapping_dict:
+            variants[variant] = canonical_name
+    return variants
+
+
+def bench_scorer(
+    normalizer: MenuNormalizer, menu_names: list[str], variants: dict[str, str], repeat: int
+) -> dict:
+    matched = normalizer.normalize_many(list(variants))
+    correct = sum(match == expected for match, expected in zip(matched, variants.values()))
+    return {
+        "batch_ms": round(best_of(repeat, lambda: normalizer.normalize_many(menu_names)), 3),
+        "variant_batch_ms": round(
+            best_of(repeat, lambda: normalizer.normalize_many(list(variants))), 3
+        ),
+        "variants": len(variants),
+        "variant_accuracy": round(correct / len(variants), 4),
+    }
+
+
+def bench_scorers(menu_names: list[str], repeat: int) -> dict:
+    """Compare the scorers on throughput and on matching respelled dictionary entries."""
+    normalizers = {
+        scorer: MenuNormalizer(cache_size=0, scorer=scorer) for scorer in MenuNormalizer.SCORERS
+    }
+    variants = respelled_variants(normalizers["wratio"])
+    return {
+        scorer: bench_scorer(normalizer, menu_names, variants, repeat)
+        for scorer, normalizer in normalizers.items()
+    }
+
+
+def bench_categorize(categorizer: MenuCategorizer, canonical_names: list[str], repeat: int) -> dict:
+    samples = [timed(categorizer.categorize, name)[0] for name in canonical_names]
+    return {
+        "names": len(canonical_names),
+        "per_name": summarize(samples),
+        "bulk_ms": round(
+            best_of(repeat, lambda: [categorizer.categorize(name) for name in canonical_names]), 3
+        ),
+        "batch_ms": round(best_of(repeat, lambda: categorizer.categorize_many(canonical_names)), 3),
+        "top_k_ms": round(
+            best_of(repeat, lambda: categorizer.categorize_top_k(canonical_names)), 3
+        ),
+    }
+
+
+def bench_training(repeat: int) -> dict:
+    """Compare a full refit with absorbing only newly reviewed rows into an incremental model.
+
+    The dictionary is shuffled and split into held-out rows for scoring, rows the incremental
+    model was trained on before, and rows reviewed since. The full refit learns from both.
+    """
+    rows = pd.read_json(MenuNormalizer.DICT_PATH, orient="records", lines=True)
+    rows = rows.sample(frac=1, random_state=42)
+    held_out = rows.iloc[: len(rows) // 5]
+    known = rows.iloc[len(rows) // 5 : len(rows) * 4 // 5]
+    reviewed = rows.iloc[len(rows) * 4 // 5 :]
+    everything = pd.concat([known, reviewed])
+
+    def accuracy(pipe) -> float:
+        predicted = pipe.predict(held_out["canonical_name"])
+        return round(float((predicted == held_out["category"]).mean()), 4)
+
+    def refit():
+        return fit_full_model(everything["canonical_name"], everything["category"])
+
+    def absorb():
+        pipe = copy.deepcopy(base)
+        absorb_rows(pipe, reviewed["canonical_name"], reviewed["category"])
+        return pipe
+
+    base = fit_incremental_model(known["canonical_name"], known["category"])
+    return {
+        "rows": {"held_out": len(held_out), "known": len(known), "reviewed": len(reviewed)},
+        "full_refit": {"train_ms": round(best_of(repeat, refit), 3), "accuracy": accuracy(refit())},
+        "incremental": {
+            "train_ms": round(best_of(repeat, absorb), 3),
+            "accuracy": accuracy(absorb()),
+            "base_accuracy": accuracy(base),
+        },
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=CRAWLER_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(raw_html_dir: pathlib.Path, sources: list[str], repeat: int) -> dict:
+    pages = load_pages(raw_html_dir, sources)
+    normalizer = MenuNormalizer(cache_size=0)
+    categorizer = MenuCategorizer()
+
+    parse_results, menu_names = bench_parse(pages)
+    canonical_names = [name for name in map(normalizer.normalize, menu_names) if name]
+
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pages": len(pages),
+            "threshold": MenuNormalizer.THRESHOLD,
+            "model_date": MenuCategorizer.promoted_model()[0],
+        },
+        "load": bench_load(repeat),
+        "parse": parse_results,
+        "normalize": bench_normalize(normalizer, menu_names, repeat),
+        "scorers": bench_scorers(menu_names, repeat),
+        "categorize": bench_categorize(categorizer, canonical_names, repeat),
+        "training": bench_training(repeat),
+    }
+
+
+def flatten(results: dict, prefix: str = "") -> dict[str, float]:
+    """Flatten nested results into {"parse.snuco.mean_ms": value} for timing metrics only."""
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        elif name.endswith("_ms") and not name.startswith("meta."):
+            flat[name] = value
+    return flat
+
+
+def compare(baseline: dict, current: dict, tolerance: float) -> list[str]:
+    """Print timing changes against baseline and return the metrics that regressed."""
+    base_metrics, current_metrics = flatten(baseline), flatten(current)
+    regressions = []
+
+    print(f"\n{'metric':<40} {'baseline':>12} {'current':>12} {'change':>9}")
+    for name, current_value in current_metrics.items():
+        base_value = base_metrics.get(name)
+        if not base_value:
+            continue
+        change = (current_value - base_value) / base_value
+        marker = ""
+        if change > tolerance:
+            marker = " ⚠️"
+            regressions.append(name)
+        print(f"{name:<40} {base_value:>12.3f} {current_value:>12.3f} {change:>+8.1%}{marker}")
+
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark parsers, normalizer and categorizer")
+    ap.add_argument(
+        "--raw-html",
+        metavar="DIR",
+        default=str(DEFAULT_RAW_HTML_DIR),
+        help=f"Directory of archived HTML files (default: {DEFAULT_RAW_HTML_DIR})",
+    )
+    ap.add_argument("--sources", nargs="+", help="Specific sources to benchmark")
+    ap.add_argument("--repeat", type=int, default=3, help="Repeat bulk timings (default: 3)")
+    ap.add_argument("-o", "--output", metavar="JSON", help="Write results to this file")
+    ap.add_argument("--compare", metavar="JSON", help="Previous results to compare against")
+    ap.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Relative slowdown reported as a regression (default: 0.1)",
+    )
+    return ap.parse_args()
+
+
+def main():
+    args = parse_args()
+    sources = args.sources or list(CrawlerRegistry._crawlers.keys())
+    results = run_benchmarks(pathlib.Path(args.raw_html), sources, args.repeat)
+
+    output = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.output:
+        pathlib.Path(args.output).write_text(output + "\n", encoding="utf-8")
+        print(f"✅ 결과가 저장되었습니다: {args.output}")
+    else:
+        print(output)
+
+    if args.compare:
+        baseline = json.loads(pathlib.Path(args.compare).read_text(encoding="utf-8"))
+        if compare(baseline, results, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -52,7 +52,8 @@ def data_maker(request):
         DataDumper.dump_menu_data(days, sources)
         pytest.exit("Menu data dumped successfully")
 
-    pytest.exit("Data generation completed successfully")
+    if request.config.getoption("--make-raw-html") or request.config.getoption("--make-train-data"):
+        pytest.exit("Data generation completed successfully")
 
 
 def _build_test_cases(config):
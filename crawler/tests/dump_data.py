@@ -2,9 +2,8 @@ import os
 from datetime import datetime, timedelta
 
 from models import MealType, OperatingHours
-from src.categorizer import MenuCategorizer
-from src.normalizer import MenuNormalizer
 from src.registry import CrawlerRegistry
+from src.shared import SharedResources
 from tests.make_data import DataMaker
 
 
@@ -36,8 +35,7 @@ class DataDumper:
         if sources is None:
             sources = list(CrawlerRegistry._crawlers.keys())
 
-        normalizer = MenuNormalizer()
-        categorizer = MenuCategorizer()
+        resolver = SharedResources.get_resolver()
 
         print()
         print(f"# {target_date.strftime('%Y년 %m월 %d일')} 메뉴\n")
@@ -103,19 +101,18 @@ class DataDumper:
                 print("|".join(cls.MENU_FIELDS))
                 print("|".join(["---"] * len(cls.MENU_FIELDS)))
 
-                for schedule in schedules:
+                resolved = resolver.resolve_many([schedule.menu.name for schedule in schedules])
+                for schedule, resolved_menu in zip(schedules, resolved):
                     menu = schedule.menu
-                    canonical_name = normalizer.normalize(menu.name)
-                    category = categorizer.categorize(canonical_name) if canonical_name else None
                     print(
                         "|",
                         "|".join(
                             [
                                 menu.name,
                                 menu.cafeteria_corner.name,
-                                canonical_name or "",
+                                ", ".join(resolved_menu.canonical_parts),
                                 menu.price or "",
-                                category.value if category else "",
+                                resolved_menu.category.value if resolved_menu.category else "",
                                 str(menu.vegetarian),
                             ]
                         ),
@@ -1,12 +1,12 @@
 import csv
-import glob
 import operator
 import os
 from datetime import datetime, timedelta
 
-from src.categorizer import MenuCategorizer
-from src.normalizer import MenuNormalizer
+from src import archive
+from src.executor import ParseJob, parse_pages
 from src.registry import CrawlerRegistry
+from src.shared import SharedResources
 
 
 class DataMaker:
@@ -21,24 +21,7 @@ class DataMaker:
         Returns:
             List of tuples containing (filename, date) for each matching file
         """
-        pattern = os.path.join(raw_html_dir, f"{source}_*.html")
-        files = glob.glob(pattern)
-
-        if not files:
-            raise FileNotFoundError(f"No HTML files found for source: {source}")
-
-        test_files = []
-        for file_path in sorted(files):
-            file_name = os.path.basename(file_path)
-            date_parts = file_name.replace(".html", "").split("_")[1:]  # [YYYY, MM, DD]
-            test_date = datetime(
-                int(date_parts[0]),  # YYYY
-                int(date_parts[1]),  # MM
-                int(date_parts[2]),  # DD
-            )
-            test_files.append((file_name, test_date))
-
-        return test_files
+        return archive.get_html_files(raw_html_dir, source)
 
     @classmethod
     def generate_raw_html(
@@ -116,62 +99,76 @@ class DataMaker:
             sources = list(CrawlerRegistry._crawlers.keys())
 
         os.makedirs(output_dir, exist_ok=True)
-        normalizer = MenuNormalizer()
-        categorizer = MenuCategorizer()
+        resolver = SharedResources.get_resolver()
         all_data = []
+        jobs = []
 
         for source in sources:
             try:
-                crawler_class = CrawlerRegistry.get_crawler(source)
-                crawler = crawler_class()
+                CrawlerRegistry.get_crawler(source)
 
                 # Get all HTML files for this source
                 html_files = cls.get_html_files(raw_html_dir, source)
-
-                for html_file, date in html_files:
-                    diff = datetime.now().date() - date.date()
-                    if (
-                        abs(diff.days) > days
-                        or (go_past and diff.days < 0)
-                        or (not go_past and diff.days > 0)
-                    ):
-                        continue
-
-                    filepath = os.path.join(raw_html_dir, html_file)
-                    with open(filepath, encoding="utf-8") as f:
-                        html_content = f.read()
-
-                    # Parse HTML and get schedules
-                    schedules = crawler.parse(html_content, date)
-
-                    # Extract menu names and their normalized versions
-                    for schedule in schedules:
-                        menu_name = schedule.menu.name
-                        canonical_name = normalizer.normalize(menu_name)
-                        category = (
-                            categorizer.categorize(canonical_name) if canonical_name else None
-                        )
-                        all_data.append(
-                            {
-                                "date": date,
-                                "source": source,
-                                "menu_name": menu_name,
-                                "canonical_name": canonical_name,
-                                "category": category.value if category else "분류없음",
-                            }
-                        )
-
-                print(f"Generated training data for {source}: {len(all_data)} entries")
-
             except Exception as e:
                 print(f"Error generating training data for {source}: {e!s}")
+                continue
+
+            for html_file, date in html_files:
+                diff = datetime.now().date() - date.date()
+                if (
+                    abs(diff.days) > days
+                    or (go_past and diff.days < 0)
+                    or (not go_past and diff.days > 0)
+                ):
+                    continue
+
+                filepath = os.path.join(raw_html_dir, html_file)
+                with open(filepath, encoding="utf-8") as f:
+                    jobs.append(ParseJob(source, f.read(), date))
+
+        # HTML 파싱은 CPU 작업이므로 프로세스 풀에서 병렬로 처리
+        parsed = [
+            (job, schedule)
+            for job, schedules in zip(jobs, parse_pages(jobs))
+            for schedule in schedules or []
+        ]
+
+        # Extract menu names and resolve them in one batch
+        menu_names = [schedule.menu.name for _, schedule in parsed]
+        # 사전의 분류를 따르는 메뉴도 모델로 점수를 매겨, 모델과 검수 결과가 어긋나는 메뉴를 드러낸다
+        resolved = resolver.resolve_many(menu_names, score_labeled=True)
+
+        for (job, _), menu_name, menu in zip(parsed, menu_names, resolved):
+            all_data.append(
+                {
+                    "date": job.date,
+                    "source": job.source,
+                    "menu_name": menu_name,
+                    "canonical_name": menu.canonical_name,
+                    "category": menu.category.value if menu.category else "분류없음",
+                    # 검수 도구가 확신이 낮은 메뉴부터 볼 수 있도록 분류에 대한 모델의 확률을 남긴다
+                    "confidence": round(menu.confidence, 4) if menu.scores else "",
+                }
+            )
+
+        for source in sources:
+            count = sum(1 for data in all_data if data["source"] == source)
+            print(f"Generated training data for {source}: {count} entries")
 
         # Save all training data to a single CSV file with current date
         current_date = datetime.now().strftime("%Y%m%d")
         csv_filepath = os.path.join(output_dir, f"training_data_{current_date}.csv")
         with open(csv_filepath, "w", encoding="utf-8", newline="") as f:
             writer = csv.DictWriter(
-                f, fieldnames=["date", "source", "menu_name", "canonical_name", "category"]
+                f,
+                fieldnames=[
+                    "date",
+                    "source",
+                    "menu_name",
+                    "canonical_name",
+                    "category",
+                    "confidence",
+                ],
             )
             writer.writeheader()
             writer.writerows(all_data)
@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from src import main
+from src.manifest import BackfillManifest
+from src.pipeline import Pipeline
+
+EMPTY_MENU_TABLE = '<table class="menu-table"><tbody></tbody></table>'
+START_DATE = datetime(2025, 3, 1)
+END_DATE = datetime(2025, 3, 3)
+SOURCES_WITH_DATE = 2  # snuco, snudorm
+
+
+def test_backfill_resumes_from_manifest(tmp_path, monkeypatch):
+    """중단된 백필은 완료되지 않은 (source, date) 단위만 다시 실행합니다."""
+    manifest_path = tmp_path / "manifest.jsonl"
+    fetched = []
+    failing_dates = {datetime(2025, 3, 2)}
+
+    def fetch(unit):
+        fetched.append(unit)
+        return None if unit.date in failing_dates else EMPTY_MENU_TABLE
+
+    pipeline = Pipeline(processes=1)
+    monkeypatch.setattr(pipeline, "_fetch", fetch)
+
+    completed = main.run_backfill(pipeline, BackfillManifest(manifest_path), START_DATE, END_DATE)
+    assert completed == SOURCES_WITH_DATE * 2
+    assert len(fetched) == SOURCES_WITH_DATE * 3
+
+    fetched.clear()
+    failing_dates.clear()
+    completed = main.run_backfill(pipeline, BackfillManifest(manifest_path), START_DATE, END_DATE)
+    assert completed == SOURCES_WITH_DATE
+    assert {unit.date for unit in fetched} == {datetime(2025, 3, 2)}
+
+    # 사전이나 모델이 바뀌면 모든 단위를 다시 실행한다
+    assert len(BackfillManifest(manifest_path, fingerprint="changed")) == 0
@@ -1,6 +1,32 @@
-from src.categorizer import MenuCategorizer
-from src.models import MealType
+import json
+import mmap
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from rapidfuzz import fuzz, process
+
+from src import archive
+from src.categorizer import MenuCategorizer, TfidfLogisticModel
+from src.compiled_dict import CompiledDict
+from src.crawler.snuco import SnucoCrawler
+from src.crawler.snudorm import SnudormCrawler
+from src.executor import CrawlExecutor, CrawlUnit
+from src.jamo import decompose
+from src.model_registry import ModelRegistry
+from src.models import Category, MealType
+from src.normalize_cache import MISSING, NormalizeCache
 from src.normalizer import MenuNormalizer
+from src.registry import CrawlerRegistry
+from src.shared import SharedResources
+from tests import update_dict
+from tests.update_dict import absorb_rows, fit_incremental_model
 
 
 def test_parser(crawler_test_data):
@@ -30,8 +56,23 @@ def test_parser(crawler_test_data):
     assert len(dinner_schedules) > 0, f"{crawler_name} 크롤러가 저녁 메뉴를 파싱하지 않았습니다."
 
 
+def test_parser_backend_parity(crawler_test_data):
+    """기본 파서 백엔드로 식단 표만 파싱한 결과가 전체 문서를 html.parser로 파싱한 결과와 같아야 합니다."""
+    crawler_class = crawler_test_data["crawler_class"]
+    html_content = crawler_test_data["html_content"]
+    test_date = crawler_test_data["test_date"]
+
+    reference = crawler_class(parser="html.parser")
+    reference.PARSE_ONLY = None
+    expected = reference.parse(html_content, test_date)
+
+    schedules = crawler_class().parse(html_content, test_date)
+
+    assert [s.model_dump() for s in schedules] == [s.model_dump() for s in expected]
+
+
 def test_normalizer(normalizer_test_data):
-    normalizer = MenuNormalizer()
+    normalizer = SharedResources.get_normalizer()
 
     for menu_name in normalizer_test_data:
         best, score = normalizer._fuzzy_matching(menu_name)
@@ -39,10 +80,476 @@ def test_normalizer(normalizer_test_data):
         print(f"{menu_name} -> {best} ({score})")
 
 
+def test_normalizer_exact_match_agrees_with_fuzzy_matching(normalizer_test_data):
+    """사전에서 바로 찾은 결과는 퍼지 매칭 결과와 같아야 합니다."""
+    normalizer = SharedResources.get_normalizer()
+
+    for menu_name in normalizer_test_data:
+        cleaned_name = normalizer._rule_based_normalization(menu_name)
+        exact = normalizer._exact_matching(cleaned_name)
+        if exact is None:
+            continue
+        best, score = normalizer._fuzzy_matching(cleaned_name)
+        assert exact == (best if score > normalizer.THRESHOLD else None)
+
+    assert normalizer.normalize(" 김치 볶음밥 ") == "김치볶음밥"
+
+
+def test_ngram_shortlist_recall():
+    """n-gram 색인으로 추린 후보에서도 전체 사전을 비교한 것과 같은 결과가 나와야 합니다."""
+    normalizer = MenuNormalizer(cache_size=0)
+    raw_html_dir = os.path.join(os.path.dirname(__file__), "back_test_data", "raw_html")
+    queries = {
+        normalizer._rule_based_normalization(schedule.menu.name)
+        for page in archive.replay_pages(raw_html_dir)
+        for schedule in CrawlerRegistry.get_crawler(page.source)().parse(
+            page.html_content, page.date
+        )
+    }
+    # 사전 항목을 조금씩 바꾼 이름 (글자 누락, 접두어, 다른 메뉴와 합쳐진 이름)
+    for i, choice in enumerate(normalizer.choices[::5]):
+        queries.update([choice[:-1], f"특식 {choice}", f"{choice}&{normalizer.choices[-i - 1]}"])
+
+    for query in queries:
+        best, score, _ = process.extractOne(query, normalizer.choices, scorer=fuzz.WRatio)
+        expected = best if score > normalizer.THRESHOLD else None
+        best, score = normalizer._fuzzy_matching(query)
+        assert (best if score > normalizer.THRESHOLD else None) == expected, query
+
+
+@pytest.mark.parametrize("scorer", MenuNormalizer.SCORERS)
+def test_normalize_many_matches_normalize(normalizer_test_data, scorer):
+    """일괄 정규화 결과는 메뉴별 정규화 결과와 같아야 합니다."""
+    normalizer = MenuNormalizer(cache_size=0, scorer=scorer)
+    menu_names = [*normalizer_test_data, *normalizer_test_data[:3]]
+
+    assert normalizer.normalize_many(menu_names) == [
+        normalizer.normalize(menu_name) for menu_name in menu_names
+    ]
+
+
+def test_compiled_dictionary_is_rebuilt_when_stale(tmp_path, monkeypatch):
+    """사전이 바뀌면 컴파일된 사전을 다시 만들어 사용해야 합니다."""
+    dict_path = tmp_path / "menu_dict.jsonl"
+    dict_path.write_bytes(MenuNormalizer.DICT_PATH.read_bytes())
+    monkeypatch.setattr(MenuNormalizer, "DICT_PATH", dict_path)
+    monkeypatch.setattr(MenuNormalizer, "COMPILED_PATH", tmp_path / "menu_dict.bin")
+
+    compiled_path = MenuNormalizer.compile()
+    normalizer = MenuNormalizer(cache_size=0)
+    assert normalizer.mapping_dict["김치찌개"] == "김치찌개"
+    assert normalizer.normalize("마라샹궈") is None
+
+    item = {"menu_name": "마라샹궈", "canonical_name": "마라샹궈", "category": "기타"}
+    with dict_path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+    assert MenuNormalizer(cache_size=0).normalize("마라샹궈") == "마라샹궈"
+    source_hash = MenuNormalizer._source_hash(dict_path.read_bytes())
+    assert CompiledDict.load(compiled_path, source_hash) is not None
+
+
+def test_rejected_compiled_dictionary_is_unmapped(tmp_path, monkeypatch):
+    """오래되었거나 깨진 컴파일된 사전은 열었던 mmap을 닫고 None을 돌려줘야 합니다."""
+    opened = []
+
+    class TrackedMmap(mmap.mmap):
+        def __new__(cls, *args, **kwargs):
+            buffer = super().__new__(cls, *args, **kwargs)
+            opened.append(buffer)
+            return buffer
+
+    monkeypatch.setattr(mmap, "mmap", TrackedMmap)
+    stale_path = tmp_path / "stale.bin"
+    stale_path.write_bytes(CompiledDict.dumps("old", {"names": ["김치찌개"]}, {}))
+    broken_path = tmp_path / "broken.bin"
+    broken_path.write_bytes(b"not a compiled dictionary")
+
+    for path in (stale_path, broken_path):
+        assert CompiledDict.load(path, "new") is None
+    assert len(opened) == len((stale_path, broken_path))
+    assert all(buffer.closed for buffer in opened)
+
+
+def test_compound_menu_parts_are_normalized_once():
+    """복합 메뉴는 각 메뉴로 나눠 정규화하고, 여러 메뉴에 나온 같은 메뉴는 한 번만 매칭합니다."""
+    normalizer = MenuNormalizer()
+    menu_names = ["짜장면,탕수육", "짜장면 + 탕수육(소)", "탕수육 / 군만두", "김치찌개"]
+
+    assert normalizer.split_compound("짜장면 + 탕수육(소)") == ["짜장면", "탕수육"]
+    assert normalizer.split_compound("김치찌개") == ["김치찌개"]
+
+    canonical_parts = normalizer.normalize_compound_many(menu_names)
+
+    assert canonical_parts[0] == canonical_parts[1] == ["짜장면", "탕수육"]
+    assert canonical_parts[3] == ["김치찌개"]
+    assert len(normalizer.cache) == len({"짜장면", "탕수육", "군만두", "김치찌개"})
+
+
+def test_jamo_scorer_matches_spelling_variants():
+    """자모 단위로 비교하면 한 글자의 표기 차이가 있는 메뉴도 찾아야 합니다."""
+    assert decompose("찌개 A") == "ㅉㅣㄱㅐ A"
+
+    normalizer = MenuNormalizer(cache_size=0, scorer="jamo")
+    variants = {"갈치찌게": "갈치찌개", "제육볶은": "제육볶음", "돈까스": "돈가스"}
+    assert normalizer.normalize_many(list(variants)) == list(variants.values())
+    with pytest.raises(ValueError):
+        MenuNormalizer(scorer="levenshtein")
+
+
+def test_normalize_cache_persists_across_runs(normalizer_test_data, tmp_path, monkeypatch):
+    """정규화 결과는 파일에 저장되어 다음 실행에서 재사용되고, 정규화 방식이 바뀌면 무시되어야 합니다."""
+    cache_path = tmp_path / "normalize_cache.json"
+    normalizer = MenuNormalizer(cache_path=cache_path)
+    expected = normalizer.normalize_many(normalizer_test_data)
+    normalizer.save_cache()
+
+    reloaded = MenuNormalizer(cache_path=cache_path)
+    assert len(reloaded.cache) == len(set(normalizer_test_data))
+    assert reloaded.normalize_many(normalizer_test_data) == expected
+
+    for setting in ("CACHE_VERSION", "SHORTLIST_SIZE"):
+        with monkeypatch.context() as patch:
+            patch.setattr(MenuNormalizer, setting, getattr(MenuNormalizer, setting) + 1)
+            assert len(MenuNormalizer(cache_path=cache_path).cache) == 0
+
+
+def test_normalize_cache_eviction_and_invalidation(tmp_path):
+    """LRU로 오래된 결과를 버리고, 사전이 바뀌면 저장된 결과를 무시합니다."""
+    cache_path = tmp_path / "normalize_cache.json"
+    cache = NormalizeCache("dict-v1", cache_path, max_size=2)
+    cache.put("백미밥", "백미밥")
+    cache.put("김치", "배추김치")
+    cache.get("백미밥")
+    cache.put("없는메뉴", None)
+
+    assert cache.get("김치") is MISSING
+    assert cache.get("없는메뉴") is None
+    cache.save()
+
+    assert NormalizeCache("dict-v1", cache_path).get("백미밥") == "백미밥"
+    assert len(NormalizeCache("dict-v2", cache_path)) == 0
+
+
 def test_categorizer(categorizer_test_data):
-    categorizer = MenuCategorizer()
+    categorizer = SharedResources.get_categorizer()
 
     for menu_name in categorizer_test_data:
         category = categorizer.categorize(menu_name)
 
         print(f"{menu_name} -> {category}")
+
+
+def test_crawl_executor_limits_requests_per_host():
+    """호스트별 동시 요청 수가 제한되고, 결과는 입력 순서와 맞아야 합니다."""
+    start = datetime(2025, 5, 1)
+    units = [
+        CrawlUnit(crawler_class, start + timedelta(days=day))
+        for day in range(6)
+        for crawler_class in (SnucoCrawler, SnudormCrawler)
+    ]
+    lock = threading.Lock()
+    running, peak = Counter(), Counter()
+
+    def fetch(unit):
+        with lock:
+            running[unit.crawler_class] += 1
+            peak[unit.crawler_class] = max(peak[unit.crawler_class], running[unit.crawler_class])
+        time.sleep(0.01)
+        with lock:
+            running[unit.crawler_class] -= 1
+        return unit
+
+    results = list(CrawlExecutor(workers=8, per_host=2).as_completed(fetch, units))
+    assert sorted(index for index, _ in results) == list(range(len(units)))
+    assert all(result == units[index] for index, result in results)
+    assert dict(peak) == {SnucoCrawler: 2, SnudormCrawler: 2}
+
+
+def test_categorize_many_matches_categorize(categorizer_test_data):
+    """일괄 분류 결과는 메뉴별 분류 결과와 같아야 하고, 정규화되지 않은 메뉴는 분류하지 않습니다."""
+    categorizer = SharedResources.get_categorizer()
+    menu_names = [*categorizer_test_data, None, *categorizer_test_data[:2]]
+
+    expected = [categorizer.categorize(name) if name else None for name in menu_names]
+    assert categorizer.categorize_many(menu_names) == expected
+
+
+def test_categorize_many_isolates_failing_names():
+    """한 메뉴의 분류가 실패해도 나머지 메뉴는 분류되어야 합니다."""
+    categorizer = MenuCategorizer()
+    model = categorizer.model
+
+    class FailingModel:
+        classes_ = model.classes_
+
+        def predict_proba(self, menu_names):
+            if "실패" in menu_names:
+                raise ValueError("bad menu name")
+            return model.predict_proba(menu_names)
+
+    categorizer.model = FailingModel()
+    categories = categorizer.categorize_many(["김치찌개", "실패", "짜장면"])
+
+    assert categories[1] is None
+    assert categories[0] == categorizer.categorize("김치찌개")
+    assert categories[2] == categorizer.categorize("짜장면")
+    assert categories[0] is not None
+
+
+def test_categorize_top_k_and_confidence_floor():
+    """상위 k개 분류를 확률 순으로 돌려주고, 확률이 기준보다 낮으면 기타로 분류합니다."""
+    categorizer = MenuCategorizer()
+    menu_names = ["김치찌개", "정체불명 신메뉴", None, "김치찌개"]
+
+    top_k = categorizer.categorize_top_k(menu_names, k=3)
+
+    assert [len(scores) for scores in top_k] == [3, 3, 0, 3]
+    assert top_k[0] == top_k[3]
+    for scores in (top_k[0], top_k[1]):
+        probabilities = [probability for _, probability in scores]
+        assert probabilities == sorted(probabilities, reverse=True)
+        assert 0 < sum(probabilities) <= 1 + 1e-9
+    assert categorizer.categorize_many(menu_names) == [
+        scores[0][0] if scores else None for scores in top_k
+    ]
+
+    # 두 메뉴의 가장 높은 확률 사이로 기준을 두면 확신이 낮은 메뉴만 기타로 분류된다
+    low, high = sorted([0, 1], key=lambda index: top_k[index][0][1])
+    categorizer.confidence_floor = (top_k[low][0][1] + top_k[high][0][1]) / 2
+    categories = categorizer.categorize_many(menu_names)
+    assert categories[low] == Category.ETC_UNKNOWN
+    assert categories[high] == top_k[high][0][0]
+    assert categories[2] is None
+
+
+def test_resolver_prefers_dictionary_categories():
+    """사전에 검수된 분류가 있는 메뉴는 모델 대신 사전의 분류를 따르고, 나머지만 모델로 분류합니다."""
+    resolver = SharedResources.get_resolver()
+    labeled = list(resolver.normalizer.category_dict)
+    unlabeled = "정체불명 신메뉴"
+    assert unlabeled not in resolver.normalizer.category_dict
+
+    categories = resolver.categorize_many([*labeled, unlabeled, None])
+
+    assert categories[: len(labeled)] == [
+        Category(resolver.normalizer.category_dict[name]) for name in labeled
+    ]
+    assert categories[-2] == resolver.categorizer.categorize(unlabeled)
+    assert categories[-1] is None
+
+    labeled_menu, unmatched_menu = resolver.resolve_many(["가자미구이 & 쌀밥", "ZZZ"])
+    assert labeled_menu.canonical_name == "가자미구이"
+    assert labeled_menu.category == Category.KOREAN_GRILLED
+    assert labeled_menu.scores == [(Category.KOREAN_GRILLED, 1.0)]
+    assert labeled_menu.confidence == 1.0
+    assert unmatched_menu.category is None
+    assert unmatched_menu.scores == []
+    assert unmatched_menu.confidence is None
+
+
+def test_resolver_scores_dictionary_categories_only_on_request(monkeypatch):
+    """파이프라인은 사전에 분류가 있는 메뉴를 모델에 보내지 않고, 데이터 도구가 요청할 때만
+    모델의 확률을 기록해 모델이 동의하지 않는 분류가 드러나야 합니다."""
+    resolver = SharedResources.get_resolver()
+    labeled = list(resolver.normalizer.category_dict)
+    top_k = resolver.categorizer.categorize_top_k(labeled)
+
+    requested = []
+    categorize_top_k = resolver.categorizer.categorize_top_k
+
+    def recording_top_k(menu_names, k, include=None):
+        requested.append((list(menu_names), k))
+        return categorize_top_k(menu_names, k, include)
+
+    monkeypatch.setattr(resolver.categorizer, "categorize_top_k", recording_top_k)
+
+    scored = resolver.score_many(labeled)
+    assert requested == [([], MenuCategorizer.DEFAULT_TOP_K)]
+    assert all(scores == [(category, 1.0)] for category, scores in scored)
+
+    requested.clear()
+    scored = resolver.score_many(labeled, score_labeled=True)
+    assert requested == [(labeled, MenuCategorizer.DEFAULT_TOP_K)]
+
+    confidences = []
+    for name, (category, scores), model_scores in zip(labeled, scored, top_k, strict=True):
+        assert category == Category(resolver.normalizer.category_dict[name])
+        assert scores[: len(model_scores)] == model_scores
+        assert len(scores) <= len(model_scores) + 1
+        confidences.append(dict(scores)[category])
+    # 모든 메뉴가 확률 1이면 점수가 모델이 아니라 사전에서 나온 것이다
+    assert max(confidences) < 1
+    assert any(confidence < scores[0][1] for confidence, (_, scores) in zip(confidences, scored))
+
+
+def test_numpy_engine_matches_sklearn_pipeline():
+    """NumPy 추론 엔진은 scikit-learn 파이프라인과 같은 점수와 분류 결과를 내야 합니다."""
+    _, model_path = MenuCategorizer.promoted_model()
+    pipeline = MenuCategorizer._load_pipeline(model_path)
+    engine = MenuCategorizer._load_engine(model_path, model_path.with_suffix(".bin"))
+    assert engine is not None, "update-dict --export-model로 모델을 다시 내보내야 합니다."
+
+    menu_names = list(SharedResources.get_normalizer().mapping_dict)
+    menu_names += ["  김치   찌개 ", "BLT 샌드위치", "ZZZ", "짬", ""]
+
+    assert list(engine.classes_) == list(pipeline.classes_)
+    np.testing.assert_allclose(
+        engine.decision_function(menu_names), pipeline.decision_function(menu_names), atol=1e-9
+    )
+    assert list(engine.predict(menu_names)) == list(pipeline.predict(menu_names))
+    np.testing.assert_allclose(
+        engine.predict_proba(menu_names), pipeline.predict_proba(menu_names), atol=1e-9
+    )
+
+
+def test_numpy_engine_matches_incremental_model():
+    """이어서 학습하는 모델(SGDClassifier)도 내보낸 뒤 같은 확률과 분류 결과를 내야 합니다."""
+    rows = pd.read_json(MenuNormalizer.DICT_PATH, orient="records", lines=True)
+    known, reviewed = rows.iloc[::2], rows.iloc[1::2]
+
+    pipeline = fit_incremental_model(known["canonical_name"], known["category"])
+    absorb_rows(pipeline, reviewed["canonical_name"], reviewed["category"])
+    # 내보낸 배열에서 다시 읽어도 확률 계산 방식이 유지되어야 한다
+    engine = TfidfLogisticModel.from_compiled(
+        CompiledDict(TfidfLogisticModel.from_pipeline(pipeline).dumps("test"))
+    )
+
+    menu_names = [*rows["canonical_name"], "정체불명 신메뉴", ""]
+    assert not engine.multinomial
+    np.testing.assert_allclose(
+        engine.predict_proba(menu_names), pipeline.predict_proba(menu_names), atol=1e-9
+    )
+    assert list(engine.predict(menu_names)) == list(pipeline.predict(menu_names))
+
+
+def test_exported_model_is_ignored_when_stale(tmp_path):
+    """모델이 바뀌면 이전에 내보낸 배열 대신 새 모델을 내보내야 합니다."""
+    model_path = tmp_path / "menu_classifier.joblib"
+    model_path.write_bytes(MenuCategorizer.promoted_model()[1].read_bytes())
+
+    engine_path = MenuCategorizer.export(model_path)
+    assert MenuCategorizer._load_engine(model_path, engine_path) is not None
+
+    model_path.write_bytes(model_path.read_bytes() + b"\0")
+    assert MenuCategorizer._load_engine(model_path, engine_path) is None
+
+
+def test_model_registry_selects_promoted_model(tmp_path):
+    """승격된 모델을 고르고, 레지스트리를 저장했다가 다시 읽어도 유지되어야 합니다."""
+    registry = ModelRegistry(tmp_path / "model_registry.json")
+    assert registry.promoted_model() is None
+
+    registry.register("20250504", "menu_classifier_20250504.joblib", training_set_hash=None)
+    registry.register("20261017-120000", tmp_path / "menu_classifier_20261017-120000.joblib")
+    registry.promote("20261017-120000")
+    with pytest.raises(KeyError):
+        registry.promote("20990101")
+    registry.save()
+
+    reloaded = ModelRegistry(tmp_path / "model_registry.json")
+    assert reloaded.promoted_model() == (
+        "20261017-120000",
+        tmp_path / "menu_classifier_20261017-120000.joblib",
+    )
+    assert reloaded.models["20250504"]["training_set_hash"] is None
+
+
+def test_categorizer_loads_the_promoted_model(tmp_path, monkeypatch):
+    """Categorizer는 레지스트리가 가리키는 모델 파일을 불러오고, 레지스트리가 없으면 오류를 내야 합니다."""
+    model_path = tmp_path / "menu_classifier_20261017-120000.joblib"
+    model_path.write_bytes(MenuCategorizer.promoted_model()[1].read_bytes())
+    MenuCategorizer.export(model_path)
+    registry = ModelRegistry(tmp_path / "model_registry.json")
+    registry.register("20261017-120000", model_path)
+    registry.promote("20261017-120000")
+    registry.save()
+
+    loaded = []
+    load_engine = MenuCategorizer._load_engine
+
+    def recording_load_engine(model_path, engine_path):
+        loaded.append(model_path)
+        return load_engine(model_path, engine_path)
+
+    monkeypatch.setattr(MenuCategorizer, "_load_engine", staticmethod(recording_load_engine))
+    monkeypatch.setattr(MenuCategorizer, "REGISTRY_PATH", registry.path)
+    categorizer = MenuCategorizer()
+
+    assert loaded == [model_path]
+    assert categorizer.model_path == model_path
+    assert isinstance(categorizer.model, TfidfLogisticModel)
+    assert MenuCategorizer.promoted_model() == ("20261017-120000", model_path)
+
+    # 다른 모델로 대신하지 않는다
+    monkeypatch.setattr(MenuCategorizer, "REGISTRY_PATH", tmp_path / "missing.json")
+    with pytest.raises(ValueError, match="No promoted model"):
+        MenuCategorizer()
+    registry.path.write_text("{", encoding="utf-8")
+    monkeypatch.setattr(MenuCategorizer, "REGISTRY_PATH", registry.path)
+    with pytest.raises(ValueError):
+        MenuCategorizer()
+
+
+def test_trained_models_are_registered_and_evaluated(tmp_path, monkeypatch, capsys):
+    """학습한 모델은 평가 결과와 함께 등록되고, 승격 전에 나란히 비교할 수 있어야 합니다."""
+    monkeypatch.setattr(update_dict, "RESOURCES_DIR", tmp_path)
+    monkeypatch.setattr(update_dict, "REGISTRY_PATH", tmp_path / "model_registry.json")
+    rows = pd.read_json(MenuNormalizer.DICT_PATH, orient="records", lines=True)
+    train_df, held_out = update_dict.split_held_out(rows)
+    assert 0 < len(held_out) < len(train_df)
+    assert not set(train_df["canonical_name"]) & set(held_out["canonical_name"])
+
+    update_dict.train_model(MenuNormalizer.DICT_PATH)
+
+    registry = ModelRegistry(tmp_path / "model_registry.json")
+    (entry,) = registry.models.values()
+    assert registry.promoted == entry["version"]
+    assert entry["training_set_hash"] == update_dict.training_set_hash(train_df)
+    assert entry["held_out_rows"] == len(held_out)
+    assert 0 < entry["accuracy"] <= 1
+    # 기기에 따라 달라지는 지연 시간은 레지스트리에 남기지 않는다
+    assert "load_ms" not in entry
+    assert "predict_ms" not in entry
+
+    # 내보낸 배열로 불러오므로 scikit-learn 모델과 같은 결과를 내야 한다
+    categorizer = MenuCategorizer(model_path=registry.model_path(entry["version"]))
+    assert isinstance(categorizer.model, TfidfLogisticModel)
+
+    capsys.readouterr()
+    update_dict.evaluate_models(MenuNormalizer.DICT_PATH, [])
+    header, row = [
+        line
+        for line in capsys.readouterr().out.splitlines()
+        if line.startswith(("  version", "* "))
+    ]
+    assert row.startswith(f"* {entry['version']} ")
+    # 표의 열이 맞아야 한다
+    assert len(header) == len(row)
+    entry = ModelRegistry(tmp_path / "model_registry.json").models[entry["version"]]
+    assert "load_ms" not in entry
+
+    # 승격되지 않은 모델 위에는 이어서 학습하지 않는다
+    update_dict.train_model_incremental(MenuNormalizer.DICT_PATH, [])
+    assert update_dict.load_incremental_model() is None
+    registry = ModelRegistry(tmp_path / "model_registry.json")
+    (incremental_version,) = set(registry.models) - {entry["version"]}
+    update_dict.promote_model(incremental_version)
+    base_version, _ = update_dict.load_incremental_model()
+    assert base_version == incremental_version
+
+
+def test_shared_resources_are_loaded_once():
+    """여러 스레드에서 동시에 요청해도 한 번만 불러오고 같은 인스턴스를 돌려줍니다."""
+    SharedResources.reset()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        normalizers = list(executor.map(lambda _: SharedResources.get_normalizer(), range(8)))
+        categorizers = list(executor.map(lambda _: SharedResources.get_categorizer(), range(8)))
+
+    assert all(normalizer is normalizers[0] for normalizer in normalizers)
+    assert all(categorizer is categorizers[0] for categorizer in categorizers)
+    assert set(SharedResources.load_times()) == {"normalizer", "categorizer"}
+
+    SharedResources.reset()
+    assert SharedResources.get_categorizer() is not categorizers[0]
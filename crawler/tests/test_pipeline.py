@@ -0,0 +1,121 @@
+import os
+
+from src import archive, main
+from src.executor import ParseJob, parse_pages
+from src.page_store import PageStore
+from src.pipeline import Page, Pipeline
+
+
+def make_page(crawler_test_data, index=0):
+    return Page(
+        source=crawler_test_data["crawler_name"],
+        date=crawler_test_data["test_date"],
+        html_content=crawler_test_data["html_content"],
+        index=index,
+    )
+
+
+def test_pipeline_streams_every_page(crawler_test_data):
+    """모든 페이지가 파싱, 정규화, 분류를 거쳐 나와야 합니다."""
+    pages = [make_page(crawler_test_data, index) for index in range(5)]
+
+    results = list(Pipeline(processes=2).stream(pages))
+
+    assert sorted(page.index for page in results) == list(range(5))
+    expected = [s.model_dump() for s in results[0].schedules]
+    for page in results:
+        assert [s.model_dump() for s in page.schedules] == expected
+        assert all(s.menu.canonical_name is None or s.menu.category for s in page.schedules)
+        assert all(
+            s.menu.category is None or s.menu.category in s.menu.category_scores
+            for s in page.schedules
+        )
+
+
+def test_unchanged_page_reuses_stored_schedules(crawler_test_data, tmp_path):
+    """HTML이 바뀌지 않은 페이지는 저장된 결과를 그대로 사용합니다."""
+    page_store = PageStore(tmp_path, fingerprint="test")
+    pipeline = Pipeline(processes=1, page_store=page_store)
+
+    (first,) = pipeline.stream([make_page(crawler_test_data)])
+    (second,) = pipeline.stream([make_page(crawler_test_data)])
+
+    assert not first.unchanged
+    assert second.unchanged
+    assert [s.model_dump() for s in second.schedules] == [s.model_dump() for s in first.schedules]
+    assert page_store.load(first.source, first.date, "<html></html>") is None
+
+
+def test_pipeline_version_invalidates_stored_pages(monkeypatch):
+    """정규화/분류 결과가 바뀌는 변경은 저장된 페이지를 다시 처리하게 해야 합니다."""
+    fingerprint = main.resource_fingerprint(0.0)
+    assert main.resource_fingerprint(0.0) == fingerprint
+
+    monkeypatch.setattr(main, "PIPELINE_VERSION", main.PIPELINE_VERSION + 1)
+    assert main.resource_fingerprint(0.0) != fingerprint
+
+    # 결과에 영향을 주는 설정도 fingerprint에 들어가야 한다
+    fingerprint = main.resource_fingerprint(0.0)
+    settings = [
+        (main.MenuNormalizer, "SHORTLIST_SIZE", main.MenuNormalizer.SHORTLIST_SIZE + 1),
+        (main.MenuNormalizer, "DEFAULT_SCORER", "jamo"),
+        (main.MenuNormalizer, "COMPILED_VERSION", main.MenuNormalizer.COMPILED_VERSION + 1),
+        (main.MenuCategorizer, "ENGINE_VERSION", main.MenuCategorizer.ENGINE_VERSION + 1),
+    ]
+    for owner, name, value in settings:
+        with monkeypatch.context() as patch:
+            patch.setattr(owner, name, value)
+            assert main.resource_fingerprint(0.0) != fingerprint, name
+    assert main.resource_fingerprint(0.5) != fingerprint
+
+
+def test_pipeline_records_stage_metrics(crawler_test_data, tmp_path):
+    """각 단계의 소요 시간과 처리량이 소스별로 기록되어야 합니다."""
+    source = crawler_test_data["crawler_name"]
+    pipeline = Pipeline(processes=1)
+
+    (page,) = pipeline.stream([make_page(crawler_test_data)])
+
+    metrics = pipeline.metrics.to_dict()
+    for stage in ("parse", "normalize", "categorize"):
+        assert metrics["latency"][stage][source]["count"] == 1
+    assert metrics["counters"]["schedules"][source] == len(page.schedules)
+
+    prom_path = tmp_path / "crawler.prom"
+    pipeline.metrics.write_prometheus(prom_path)
+    assert f'siksha_crawler_pages_total{{source="{source}"}} 1' in prom_path.read_text()
+
+    # 큰 카운터도 반올림되지 않아야 한다
+    line = f'siksha_crawler_fetched_bytes_total{{source="{source}"}}'
+    pipeline.metrics.increment("fetched_bytes", source, 1234567)
+    pipeline.metrics.write_prometheus(prom_path)
+    assert f"{line} 1234567\n" in prom_path.read_text()
+    pipeline.metrics.increment("fetched_bytes", source, 0.5)
+    pipeline.metrics.write_prometheus(prom_path)
+    assert f"{line} 1234567.5\n" in prom_path.read_text()
+
+
+def test_process_pool_parse_matches_serial_parse(crawler_test_data):
+    """프로세스 풀에서 파싱한 결과가 직접 파싱한 결과와 같아야 합니다."""
+    crawler = crawler_test_data["crawler_class"]()
+    html_content = crawler_test_data["html_content"]
+    test_date = crawler_test_data["test_date"]
+    jobs = [ParseJob(crawler_test_data["crawler_name"], html_content, test_date)] * 2
+
+    expected = [s.model_dump() for s in crawler.parse(html_content, test_date)]
+    for schedules in parse_pages(jobs, processes=2):
+        assert [s.model_dump() for s in schedules] == expected
+
+
+def test_replay_runs_every_archived_page():
+    """--replay는 아카이브된 모든 페이지를 네트워크 없이 처리합니다."""
+    raw_html_dir = os.path.join(os.path.dirname(__file__), "back_test_data", "raw_html")
+    pages = list(archive.replay_pages(raw_html_dir))
+
+    schedules = main.run_replay(Pipeline(processes=2), raw_html_dir)
+
+    assert [page.index for page in pages] == list(range(len(pages)))
+    assert len(schedules) == sum(
+        len(parse_pages([ParseJob(page.source, page.html_content, page.date)], 1)[0])
+        for page in pages
+    )
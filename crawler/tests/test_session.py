@@ -0,0 +1,132 @@
+import os
+import time
+from datetime import datetime
+
+import pytest
+from requests import Response
+from requests.adapters import BaseAdapter
+
+from src.crawler.cache import ResponseCache
+from src.crawler.session import HttpSession
+from src.crawler.snudorm import SnudormCrawler
+
+TIMEOUT = 3
+
+
+class LocalTransport(BaseAdapter):
+    """네트워크 대신 미리 준비한 페이지를 돌려주는 transport입니다."""
+
+    def __init__(self, pages: dict[str, str], etag: str | None = None):
+        super().__init__()
+        self.pages = pages
+        self.etag = etag
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append((request, kwargs))
+        response = Response()
+        response.request = request
+        response.url = request.url
+        response.encoding = "utf-8"
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            response.status_code = 304
+            response._content = b""
+            return response
+
+        response.status_code = 200 if request.url in self.pages else 404
+        response._content = self.pages.get(request.url, "").encode("utf-8")
+        if self.etag:
+            response.headers["ETag"] = self.etag
+        return response
+
+    def close(self):
+        pass
+
+
+def test_crawler_fetches_through_injected_transport():
+    url = "https://snudorm.snu.ac.kr/foodmenu/?date=2025-03-24"
+    transport = LocalTransport({url: "<html>식단</html>"})
+    session = HttpSession(timeout=TIMEOUT, transport=transport)
+
+    html = SnudormCrawler(session=session).fetch_html(datetime(2025, 3, 24))
+
+    assert html == "<html>식단</html>"
+    request, kwargs = transport.sent[0]
+    assert kwargs["timeout"] == TIMEOUT
+    assert "gzip" in request.headers["Accept-Encoding"]
+
+
+def test_crawler_raises_on_http_error():
+    session = HttpSession(transport=LocalTransport({}))
+
+    with pytest.raises(Exception, match="404"):
+        SnudormCrawler(session=session).fetch_html(datetime(2025, 3, 24))
+
+
+def test_unchanged_page_is_served_from_cache(tmp_path):
+    url = "https://snudorm.snu.ac.kr/foodmenu/?date=2025-03-24"
+    transport = LocalTransport({url: "<html>식단</html>"}, etag='"v1"')
+    session = HttpSession(transport=transport, cache=ResponseCache(tmp_path))
+    crawler = SnudormCrawler(session=session)
+
+    first = crawler.fetch_html(datetime(2025, 3, 24))
+    second = crawler.fetch_html(datetime(2025, 3, 24))
+
+    assert first == second == "<html>식단</html>"
+    assert "If-None-Match" not in transport.sent[0][0].headers
+    assert transport.sent[1][0].headers["If-None-Match"] == '"v1"'
+
+
+def test_cache_evicts_old_entries(tmp_path):
+    cache = ResponseCache(tmp_path)
+    cache.put("https://a", "a" * 100, etag='"a"', last_modified=None)
+    cache.put("https://b", "b" * 100, etag='"b"', last_modified=None)
+    os.utime(cache._path("https://a"), (0, time.time() - 60))
+
+    # 용량을 넘으면 가장 오래된 항목부터 지운다
+    cache.max_bytes = cache._path("https://b").stat().st_size
+    cache.evict()
+    assert cache.get("https://a") is None
+    assert cache.get("https://b") is not None
+
+    # 만료된 항목은 조회되지 않는다
+    cache.max_age = -1
+    assert cache.get("https://b") is None
+
+
+def test_cache_stays_under_max_bytes_while_writing(tmp_path):
+    cache = ResponseCache(tmp_path)
+    cache.put("https://a", "a" * 100, etag='"a"', last_modified=None)
+    cache.max_bytes = cache._path("https://a").stat().st_size * 3
+
+    evictions = []
+    evict = cache.evict
+    cache.evict = lambda target_bytes=None: evictions.append(target_bytes) or evict(target_bytes)
+
+    # 실행 중에 쓰는 항목만으로도 용량을 넘지 않아야 한다
+    writes = 10
+    for index in range(writes):
+        cache.put(f"https://{index}", "b" * 100, etag='"b"', last_modified=None)
+        assert sum(path.stat().st_size for path in tmp_path.glob("*.json")) <= cache.max_bytes
+    assert cache.get(f"https://{writes - 1}") is not None
+    # 용량을 넘을 때마다가 아니라 여유가 생길 만큼 한 번에 비운다
+    assert 0 < len(evictions) < writes
+    assert all(target < cache.max_bytes for target in evictions)
+
+
+def test_cache_cleans_up_temporary_files(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path)
+    stale = tmp_path / "interrupted.tmp"
+    stale.write_text("{")
+    os.utime(stale, (0, time.time() - cache.STALE_TMP_AGE - 1))
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        cache.put("https://a", "a", etag='"a"', last_modified=None)
+    assert list(tmp_path.glob("*.tmp")) == [stale]
+
+    cache.evict()
+    assert list(tmp_path.glob("*.tmp")) == []
@@ -1,18 +1,29 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import itertools
 import json
 import os
 import pathlib
 import sys
+import time
 from collections.abc import Iterable
 from datetime import datetime
 
 import joblib
+import numpy as np
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.pipeline import make_pipeline
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.pipeline import Pipeline, make_pipeline
+
+CRAWLER_ROOT = pathlib.Path(__file__).parent.parent
+sys.path[:0] = [str(CRAWLER_ROOT), str(CRAWLER_ROOT / "src")]
+
+from src.categorizer import MenuCategorizer  # noqa: E402
+from src.model_registry import ModelRegistry  # noqa: E402
+from src.normalizer import MenuNormalizer  # noqa: E402
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Configuration
@@ -46,6 +57,17 @@ ALLOWED_CATEGORIES: list[str] = [
 DEFAULT_TRAIN_DIR = pathlib.Path(__file__).parent / "back_test_data" / "training_data"
 DEFAULT_DICT_PATH = pathlib.Path(__file__).parent.parent / "src" / "resources" / "menu_dict.jsonl"
 RESOURCES_DIR = pathlib.Path(__file__).parent.parent / "src" / "resources"
+REGISTRY_PATH = ModelRegistry.DEFAULT_PATH
+
+# 이어서 학습하는 모델(SGDClassifier) 설정
+INCREMENTAL_ALPHA = 1e-4
+BOOTSTRAP_EPOCHS = 20  # 사전 전체로 처음 학습할 때
+INCREMENTAL_EPOCHS = 5  # 새로 검수한 항목만 반영할 때
+
+# 정규화된 이름의 해시로 사전의 약 1/10을 모델 평가용으로 남긴다
+HOLDOUT_BUCKETS = 10
+# 지연 시간은 실행한 기기에 따라 달라지므로 출력만 하고, 레지스트리에는 평가 결과만 남긴다
+RECORDED_METRICS = ("held_out_rows", "accuracy")
 
 
 def find_csv_files(directory: pathlib.Path) -> list[pathlib.Path]:
@@ -59,6 +81,21 @@ def load_training_data(path: pathlib.Path) -> pd.DataFrame:
     return pd.read_csv(path)
 
 
+def load_review_data(csv_files: list[pathlib.Path], uncertain_first: bool) -> pd.DataFrame:
+    """학습 데이터를 합치고, uncertain_first이면 모델이 확신하지 못한 메뉴부터 정렬합니다.
+
+    분류되지 않은 메뉴가 가장 먼저 오고, 사전에서 분류를 찾은 메뉴도 모델이 그 분류에 준 확률이
+    낮은 순서로, 즉 모델과 검수 결과가 어긋나는 메뉴부터 옵니다.
+    """
+    df = pd.concat([load_training_data(f) for f in csv_files], ignore_index=True)
+    if not uncertain_first:
+        return df
+    if "confidence" not in df.columns:
+        print("⚠️ 학습 데이터에 분류 확률이 없어 원래 순서대로 검수합니다.")
+        return df
+    return df.sort_values("confidence", na_position="first", kind="stable").reset_index(drop=True)
+
+
 def load_menu_dict(path: pathlib.Path) -> tuple[list[dict], dict[str, dict], set[str]]:
     """메뉴 사전을 로드하고 중복 체크를 위한 인덱스를 생성합니다."""
     items: list[dict] = []
@@ -158,28 +195,231 @@ def save_with_options(items: Iterable[dict], default_path: pathlib.Path):
             print("⚠️ 1, 2 중 하나를 선택하세요.")
 
 
-def train_model(dict_path: pathlib.Path):
-    """메뉴 분류 모델을 재학습합니다."""
-    print("\n모델 재학습을 시작합니다...")
+def make_vectorizer() -> TfidfVectorizer:
+    return TfidfVectorizer(analyzer="char", ngram_range=(2, 4), min_df=3)
 
-    # 데이터 로드
-    train_df = pd.read_json(dict_path, orient="records", lines=True)
-    x = train_df["canonical_name"]
-    y = train_df["category"]
 
-    # 모델 학습
+def fit_full_model(x: pd.Series, y: pd.Series) -> Pipeline:
+    """사전 전체로 분류 모델을 처음부터 학습합니다."""
     pipe = make_pipeline(
-        TfidfVectorizer(analyzer="char", ngram_range=(2, 4), min_df=3),
+        make_vectorizer(),
         LogisticRegression(max_iter=200, C=10, class_weight="balanced", random_state=42),
     )
     pipe.fit(x, y)
+    return pipe
 
-    # 모델 저장
-    timestamp = datetime.now().strftime("%Y%m%d")
-    model_path = RESOURCES_DIR / f"menu_classifier_{timestamp}.joblib"
+
+def fit_incremental_model(x: pd.Series, y: pd.Series) -> Pipeline:
+    """이후 새로 검수한 항목만 이어서 학습할 수 있는 모델을 학습합니다.
+
+    어휘와 IDF는 여기서 정해지고, 이어서 학습할 때는 분류기만 partial_fit으로 갱신됩니다.
+    """
+    pipe = make_pipeline(
+        make_vectorizer().fit(x),
+        SGDClassifier(loss="log_loss", alpha=INCREMENTAL_ALPHA, random_state=42),
+    )
+    absorb_rows(pipe, x, y, BOOTSTRAP_EPOCHS)
+    return pipe
+
+
+def absorb_rows(pipe: Pipeline, x: pd.Series, y: pd.Series, epochs: int = INCREMENTAL_EPOCHS):
+    """주어진 항목만 모델에 반영합니다 (어휘에 없는 n-gram은 다음 전체 학습 때 반영됨)."""
+    features = pipe[0].transform(x)
+    labels = np.asarray(y)
+    rng = np.random.default_rng(42)
+    for _ in range(epochs):
+        order = rng.permutation(len(labels))
+        pipe[-1].partial_fit(features[order], labels[order], classes=ALLOWED_CATEGORIES)
+
+
+def load_incremental_model() -> tuple[str, Pipeline] | None:
+    """크롤러가 사용하는(승격된) 모델이 이어서 학습할 수 있으면 (버전, 모델)로 불러옵니다.
+
+    등록되지 않았거나 승격되지 않은 모델 위에는 이어서 학습하지 않습니다.
+    """
+    promoted = ModelRegistry(REGISTRY_PATH).promoted_model()
+    if promoted is None:
+        return None
+    version, model_path = promoted
+    pipe = joblib.load(model_path)
+    if not hasattr(pipe[-1], "partial_fit"):
+        print(f"  → 승격된 모델({version})은 이어서 학습할 수 없습니다.")
+        return None
+    print(f"  → 이어서 학습할 모델: {model_path.name}")
+    return version, pipe
+
+
+def is_held_out(canonical_name: str) -> bool:
+    """평가용으로 남겨 두는 항목인지 정합니다 (같은 정규화된 이름은 항상 같은 쪽)."""
+    return hashlib.sha256(canonical_name.encode()).digest()[0] % HOLDOUT_BUCKETS == 0
+
+
+def split_held_out(rows: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """사전 항목을 (학습용, 평가용)으로 나눕니다."""
+    held_out = rows["canonical_name"].map(is_held_out)
+    return rows[~held_out], rows[held_out]
+
+
+def training_set_hash(rows: pd.DataFrame) -> str:
+    """학습에 쓴 항목의 해시 (순서와 무관)."""
+    records = rows[["menu_name", "canonical_name", "category"]].to_dict("records")
+    lines = sorted(json.dumps(record, ensure_ascii=False, sort_keys=True) for record in records)
+    return hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
+
+def evaluate_model(model_path: pathlib.Path, held_out: pd.DataFrame) -> dict:
+    """크롤러와 같은 방식으로 모델을 불러와 평가용 항목의 정확도와 지연 시간을 잽니다."""
+    start = time.perf_counter()
+    categorizer = MenuCategorizer(model_path=model_path)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    categories = categorizer.categorize_many(held_out["canonical_name"].tolist())
+    predict_ms = (time.perf_counter() - start) * 1000
+
+    predicted = [category.value if category else None for category in categories]
+    correct = sum(p == y for p, y in zip(predicted, held_out["category"]))
+    return {
+        "held_out_rows": len(held_out),
+        "accuracy": round(correct / max(len(held_out), 1), 4),
+        "load_ms": round(load_ms, 3),
+        "predict_ms": round(predict_ms, 3),
+    }
+
+
+def recorded_metrics(metrics: dict) -> dict:
+    """평가 결과 중 모델 레지스트리에 남길 항목만 고릅니다."""
+    return {key: metrics[key] for key in RECORDED_METRICS}
+
+
+def save_model(pipe: Pipeline, train_hash: str, held_out: pd.DataFrame):
+    """모델을 저장하고, 추론용 배열로 내보낸 뒤 평가해 모델 레지스트리에 등록합니다."""
+    registry = ModelRegistry(REGISTRY_PATH)
+    # 같은 날 여러 번 학습해도 등록된 모델을 덮어쓰지 않도록 시각까지 버전에 넣는다
+    version = base_version = datetime.now().strftime("%Y%m%d-%H%M%S")
+    for suffix in itertools.count(2):
+        model_path = RESOURCES_DIR / f"menu_classifier_{version}.joblib"
+        if version not in registry.models and not model_path.exists():
+            break
+        version = f"{base_version}-{suffix}"
     joblib.dump(pipe, model_path, compress=3)
 
     print(f"✅ 모델이 저장되었습니다: {model_path}")
+    export_model(model_path)
+
+    entry = registry.register(
+        version,
+        model_path,
+        training_set_hash=train_hash,
+        trained_at=datetime.now().isoformat(timespec="seconds"),
+        **recorded_metrics(evaluate_model(model_path, held_out)),
+    )
+    if registry.promoted is None:
+        registry.promote(version)
+    registry.save()
+    print(f"✅ 모델 레지스트리에 등록되었습니다: {version} (평가 정확도 {entry['accuracy']:.1%})")
+    if registry.promoted != version:
+        print(f"  → 비교: --evaluate, 크롤러에 적용: --promote {version}")
+
+
+def train_model(dict_path: pathlib.Path):
+    """메뉴 분류 모델을 재학습합니다."""
+    print("\n모델 재학습을 시작합니다...")
+
+    # 데이터 로드 (평가용 항목은 학습에서 뺀다)
+    train_df, held_out = split_held_out(pd.read_json(dict_path, orient="records", lines=True))
+    pipe = fit_full_model(train_df["canonical_name"], train_df["category"])
+    save_model(pipe, training_set_hash(train_df), held_out)
+
+
+def train_model_incremental(dict_path: pathlib.Path, new_items: list[dict]):
+    """새로 검수한 항목만 승격된 모델에 이어서 학습합니다."""
+    print("\n새로 검수한 항목을 모델에 반영합니다...")
+
+    train_df, held_out = split_held_out(pd.read_json(dict_path, orient="records", lines=True))
+    base = load_incremental_model()
+    if base is None:
+        print("  → 이어서 학습할 모델이 없어 사전 전체로 새로 학습합니다.")
+        pipe = fit_incremental_model(train_df["canonical_name"], train_df["category"])
+        train_hash = training_set_hash(train_df)
+    else:
+        base_version, pipe = base
+        new_df, _ = split_held_out(pd.DataFrame(new_items, columns=list(train_df.columns)))
+        if new_df.empty:
+            print("  → 새로 검수한 항목이 없습니다.")
+            return
+        absorb_rows(pipe, new_df["canonical_name"], new_df["category"])
+        # 이어서 학습한 모델의 학습 데이터는 이전 모델의 학습 데이터에 새 항목을 더한 것이다
+        base_hash = (
+            ModelRegistry(REGISTRY_PATH).models.get(base_version, {}).get("training_set_hash")
+        )
+        train_hash = hashlib.sha256(
+            f"{base_hash or base_version}:{training_set_hash(new_df)}".encode()
+        ).hexdigest()
+
+    save_model(pipe, train_hash, held_out)
+
+
+def evaluate_models(dict_path: pathlib.Path, versions: list[str]):
+    """등록된 모델들을 같은 평가용 항목으로 나란히 평가하고, 정확도를 레지스트리에 기록합니다."""
+    registry = ModelRegistry(REGISTRY_PATH)
+    _, held_out = split_held_out(pd.read_json(dict_path, orient="records", lines=True))
+
+    versions = versions or sorted(registry.models)
+    width = max([len("version"), *map(len, versions)])
+
+    print(f"\n평가용 항목: {len(held_out)}개\n")
+    print(f"  {'version':<{width}} {'accuracy':>9} {'load_ms':>10} {'predict_ms':>11}")
+    for version in versions:
+        if version not in registry.models:
+            print(f"⚠️ 등록되지 않은 모델입니다: {version}")
+            continue
+        metrics = evaluate_model(registry.model_path(version), held_out)
+        registry.models[version].update(recorded_metrics(metrics))
+        marker = "*" if version == registry.promoted else " "
+        print(
+            f"{marker} {version:<{width}} {metrics['accuracy']:>9.1%} "
+            f"{metrics['load_ms']:>10.2f} {metrics['predict_ms']:>11.2f}"
+        )
+    registry.save()
+    print("\n(* 크롤러가 사용하는 모델)")
+
+
+def promote_model(version: str):
+    """크롤러가 사용할 모델을 바꿉니다."""
+    registry = ModelRegistry(REGISTRY_PATH)
+    registry.promote(version)
+    registry.save()
+    print(f"✅ 크롤러가 이제 {registry.model_path(version).name} 모델을 사용합니다.")
+
+
+def prompt_retrain(saved_path: pathlib.Path, reviewed_items: list[dict], incremental: bool):
+    if input("\n모델을 재학습하시겠습니까? (ㅇ/ㄴ): ").lower() != "ㅇ":
+        return
+    if incremental:
+        train_model_incremental(saved_path, reviewed_items)
+    else:
+        train_model(saved_path)
+
+
+def export_model(model_path: pathlib.Path | None = None):
+    """크롤러가 scikit-learn 없이 분류할 수 있도록 모델의 어휘, IDF, 계수를 내보냅니다.
+
+    model_path가 없으면 크롤러가 사용하는(승격된) 모델을 내보냅니다.
+    """
+    engine_path = MenuCategorizer.export(model_path)
+    print(f"✅ 추론용 모델이 저장되었습니다: {engine_path}")
+
+
+def compile_dict(dict_path: pathlib.Path):
+    """크롤러가 읽는 사전이 바뀌었으면 컴파일된 사전을 다시 만듭니다."""
+    if dict_path.resolve() != MenuNormalizer.DICT_PATH.resolve():
+        print(
+            f"⚠️ {dict_path}는 크롤러가 읽는 사전({MenuNormalizer.DICT_PATH})이 아니라 컴파일하지 않습니다."
+        )
+        return
+    compiled_path = MenuNormalizer.compile()
+    print(f"✅ 컴파일된 사전이 저장되었습니다: {compiled_path}")
 
 
 def clear_screen():
@@ -187,7 +427,21 @@ def clear_screen():
     os.system("cls" if os.name == "nt" else "clear")
 
 
-def run_reviewer(train_dir: pathlib.Path, dict_path: pathlib.Path):
+def print_session_header(
+    csv_files: list[pathlib.Path], train_dir: pathlib.Path, dict_path: pathlib.Path, records: int
+):
+    print("\n────────────────────────────────────────────────────────────────────────────")
+    print(f"🗂️ Training files: {len(csv_files)} files in {train_dir}")
+    print(f"📓 Dictionary    : {dict_path} ({records} records loaded)")
+    print("────────────────────────────────────────────────────────────────────────────\n")
+
+
+def run_reviewer(
+    train_dir: pathlib.Path,
+    dict_path: pathlib.Path,
+    uncertain_first: bool = False,
+    incremental: bool = False,
+):
     csv_files = find_csv_files(train_dir)
     if not csv_files:
         print(f"❌ No CSV files found in {train_dir}")
@@ -197,13 +451,10 @@ def run_reviewer(train_dir: pathlib.Path, dict_path: pathlib.Path):
     for i, f in enumerate(csv_files, 1):
         print(f"  {i}. {f.name}")
 
-    df = pd.concat([load_training_data(f) for f in csv_files], ignore_index=True)
+    df = load_review_data(csv_files, uncertain_first)
     items, canonical_to_item, menu_names = load_menu_dict(dict_path)
-
-    print("\n────────────────────────────────────────────────────────────────────────────")
-    print(f"🗂️ Training files: {len(csv_files)} files in {train_dir}")
-    print(f"📓 Dictionary    : {dict_path} ({len(items)} records loaded)")
-    print("────────────────────────────────────────────────────────────────────────────\n")
+    reviewed_items: list[dict] = []
+    print_session_header(csv_files, train_dir, dict_path, len(items))
 
     for idx, row in df.iterrows():
         clear_screen()
@@ -250,14 +501,14 @@ def run_reviewer(train_dir: pathlib.Path, dict_path: pathlib.Path):
             "category": category,
         }
         items.append(new_item)
+        reviewed_items.append(new_item)
         canonical_to_item[new_canonical_name] = new_item
         menu_names.add(original_name)
 
     saved_path = save_with_options(items, dict_path)
     print("\n✅ 검수가 완료되었습니다: 사전이 업데이트되었습니다 (정렬: canonical_name).")
-
-    if input("\n모델을 재학습하시겠습니까? (ㅇ/ㄴ): ").lower() == "ㅇ":
-        train_model(saved_path)
+    compile_dict(saved_path)
+    prompt_retrain(saved_path, reviewed_items, incremental)
 
     return items
 
@@ -278,6 +529,40 @@ def parse_args() -> argparse.Namespace:
         default=str(DEFAULT_DICT_PATH),
         help=f"Path to menu_dict.jsonl (default: {DEFAULT_DICT_PATH})",
     )
+    ap.add_argument(
+        "--uncertain-first",
+        action="store_true",
+        help="Review the menus categorized with the lowest confidence first",
+    )
+    ap.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Retrain by absorbing only the reviewed rows into the latest incremental model",
+    )
+    ap.add_argument(
+        "--compile",
+        action="store_true",
+        help="Only compile the dictionary into the binary artifact loaded by the normalizer",
+    )
+    ap.add_argument(
+        "--export-model",
+        metavar="JOBLIB",
+        nargs="?",
+        const="",
+        help="Only export a trained model (default: the one used by the crawler) "
+        "into the arrays loaded by the NumPy inference engine",
+    )
+    ap.add_argument(
+        "--evaluate",
+        metavar="VERSION",
+        nargs="*",
+        help="Only evaluate registered models (default: all) side by side on held-out rows",
+    )
+    ap.add_argument(
+        "--promote",
+        metavar="VERSION",
+        help="Only promote a registered model, so the crawler uses it",
+    )
     return ap.parse_args()
 
 
@@ -286,8 +571,21 @@ def main():
     train_dir = pathlib.Path(args.train)
     dict_path = pathlib.Path(args.dict)
 
+    if args.compile:
+        compile_dict(dict_path)
+        return
+    if args.export_model is not None:
+        export_model(pathlib.Path(args.export_model) if args.export_model else None)
+        return
+    if args.evaluate is not None:
+        evaluate_models(dict_path, args.evaluate)
+        return
+    if args.promote:
+        promote_model(args.promote)
+        return
+
     try:
-        items = run_reviewer(train_dir, dict_path)
+        items = run_reviewer(train_dir, dict_path, args.uncertain_first, args.incremental)
     except KeyboardInterrupt:
         print("\n⏹️ 검수가 중단되었습니다.")
         if input("현재 작업을 저장하시겠습니까? (ㅇ/ㄴ): ").lower() == "ㅇ":